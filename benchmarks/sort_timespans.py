@@ -0,0 +1,75 @@
+"""
+Compares sorting performed and silent timespans with ``TimespanList.sort()``
+against ``tsmakers.sort_timespans()``.
+
+Run with ``python benchmarks/sort_timespans.py [count]``.
+"""
+import random
+import sys
+import timeit
+
+import abjad
+
+import tsmakers
+
+
+def make_timespans(count, seed=0):
+    rng = random.Random(seed)
+    timespans = []
+    for _ in range(count):
+        start_offset = abjad.Offset(
+            rng.randint(0, count // 4), rng.choice([1, 2, 4, 8])
+        )
+        stop_offset = start_offset + abjad.Duration(rng.randint(1, 8), 8)
+        voice_name = "Voice {}".format(rng.randint(1, 40))
+        if rng.random() < 0.25:
+            timespan = tsmakers.SilentTimespan(
+                start_offset=start_offset,
+                stop_offset=stop_offset,
+                voice_name=voice_name,
+            )
+        else:
+            timespan = tsmakers.PerformedTimespan(
+                start_offset=start_offset,
+                stop_offset=stop_offset,
+                voice_name=voice_name,
+            )
+        timespans.append(timespan)
+    return timespans
+
+
+def time_sort(sort, timespans, repeat):
+    # Copies the timespans in setup, which timeit leaves out of the timing.
+    timespan_lists = []
+
+    def setup():
+        timespan_lists[:] = [abjad.TimespanList(timespans)]
+
+    def sort_last_copy():
+        sort(timespan_lists[-1])
+
+    return timeit.repeat(sort_last_copy, setup=setup, number=1, repeat=repeat)
+
+
+def main(count):
+    timespans = make_timespans(count)
+
+    def sort_with_lt(timespan_list):
+        timespan_list.sort()
+
+    with_lt = min(time_sort(sort_with_lt, timespans, 3))
+    # The first keyed sort fills each timespan's cached sort key.
+    cold = time_sort(tsmakers.sort_timespans, timespans, 1)[0]
+    with_keys = min(time_sort(tsmakers.sort_timespans, timespans, 3))
+    print("timespans:             {}".format(count))
+    print("TimespanList.sort():   {:.3f}s".format(with_lt))
+    print("sort_timespans() cold: {:.3f}s".format(cold))
+    print("sort_timespans() warm: {:.3f}s".format(with_keys))
+    if 0 < with_keys:
+        print("speedup (warm):        {:.1f}x".format(with_lt / with_keys))
+    else:
+        print("speedup (warm):        too fast to measure")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if 1 < len(sys.argv) else 100000)
@@ -0,0 +1,58 @@
+"""
+Times repeating ``TaleaTimespanMaker`` output over growing target timespans,
+to check that whole periods are tiled rather than made step by step.
+
+Run with ``python benchmarks/talea_repeat.py [bars] [voices]``.
+"""
+import sys
+import timeit
+
+import abjad
+from abjadext import rmakers
+
+import tsmakers
+
+
+def make_timespans(bars, voices):
+    timespan_maker = tsmakers.TaleaTimespanMaker(
+        padding=abjad.Duration(1, 8),
+        playing_talea=rmakers.Talea([2, 3, 1, 4], 8),
+        playing_groupings=[1, 2, 3],
+        silence_talea=rmakers.Talea([1, 2], 8),
+    )
+    music_specifiers = {
+        "Voice {}".format(_): [
+            tsmakers.MusicSpecifier(seed=0),
+            tsmakers.MusicSpecifier(seed=1),
+        ]
+        for _ in range(voices)
+    }
+    return timespan_maker(
+        music_specifiers=music_specifiers,
+        target_timespan=abjad.Timespan(0, bars),
+    )
+
+
+def main(bars, voices):
+    print("voices: {}".format(voices))
+    for factor in (1, 2, 4, 8):
+        count = bars * factor
+        seconds = min(
+            timeit.repeat(
+                lambda: make_timespans(count, voices),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            "bars: {:5d}  time: {:7.3f}s  per bar: {:.2f}ms".format(
+                count, seconds, 1000 * seconds / count
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if 1 < len(sys.argv) else 250,
+        int(sys.argv[2]) if 2 < len(sys.argv) else 4,
+    )
@@ -0,0 +1,66 @@
+"""
+Times lengthening a ``TaleaTimespanMaker`` run bar by bar, remaking the whole
+run each time against resuming it from the state of the run before.
+
+Run with ``python benchmarks/talea_resume.py [bars] [voices]``.
+"""
+import sys
+import time
+
+import abjad
+from abjadext import rmakers
+
+import tsmakers
+
+
+def make_timespan_maker():
+    return tsmakers.TaleaTimespanMaker(
+        playing_talea=rmakers.Talea([2, 3, 1, 4], 8),
+        playing_groupings=[1, 2, 3],
+        silence_talea=rmakers.Talea([1, 2], 8),
+        synchronize_step=True,
+    )
+
+
+def remake(bars, music_specifiers):
+    timespan_maker = make_timespan_maker()
+    for bar in range(1, bars + 1):
+        timespans = timespan_maker(
+            music_specifiers=music_specifiers,
+            target_timespan=abjad.Timespan(0, bar),
+        )
+    return timespans
+
+
+def resume(bars, music_specifiers):
+    timespan_maker = make_timespan_maker()
+    timespans, state = None, None
+    for bar in range(1, bars + 1):
+        timespans, state = timespan_maker.make_resumable(
+            music_specifiers=music_specifiers,
+            state=state,
+            target_timespan=abjad.Timespan(0, bar),
+            timespan_list=timespans,
+            timespan_list_is_sorted=True,
+        )
+    return timespans
+
+
+def main(bars, voices):
+    music_specifiers = {"Voice {}".format(_): None for _ in range(voices)}
+    print("bars: {}  voices: {}".format(bars, voices))
+    results = []
+    for procedure in (remake, resume):
+        start = time.perf_counter()
+        timespans = procedure(bars, music_specifiers)
+        seconds = time.perf_counter() - start
+        results.append(format(timespans))
+        print("{:>8}: {:7.3f}s".format(procedure.__name__, seconds))
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if 1 < len(sys.argv) else 100,
+        int(sys.argv[2]) if 2 < len(sys.argv) else 4,
+    )
@@ -0,0 +1,53 @@
+"""
+Times ``TaleaTimespanMaker`` with a synchronized step over growing target
+timespans, to check that the time per bar stays flat.
+
+Run with ``python benchmarks/talea_synchronized_step.py [bars] [voices]``.
+"""
+import sys
+import timeit
+
+import abjad
+from abjadext import rmakers
+
+import tsmakers
+
+
+def make_timespans(bars, voices):
+    timespan_maker = tsmakers.TaleaTimespanMaker(
+        playing_talea=rmakers.Talea([2, 3, 1], 8),
+        playing_groupings=[1, 2],
+        silence_talea=rmakers.Talea([1], 8),
+        step_anchor=abjad.Right,
+        synchronize_step=True,
+    )
+    music_specifiers = {"Voice {}".format(_): None for _ in range(voices)}
+    return timespan_maker(
+        music_specifiers=music_specifiers,
+        target_timespan=abjad.Timespan(0, bars),
+    )
+
+
+def main(bars, voices):
+    print("voices: {}".format(voices))
+    for factor in (1, 2, 4, 8):
+        count = bars * factor
+        seconds = min(
+            timeit.repeat(
+                lambda: make_timespans(count, voices),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            "bars: {:5d}  time: {:7.3f}s  per bar: {:.2f}ms".format(
+                count, seconds, 1000 * seconds / count
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if 1 < len(sys.argv) else 25,
+        int(sys.argv[2]) if 2 < len(sys.argv) else 8,
+    )
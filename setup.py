@@ -2,11 +2,14 @@ from setuptools import setup
 
 install_requires = ["abjad", "abjad-ext-rmakers", "quicktions"]
 
+extras_require = {"numpy": ["numpy"]}
+
 setup(
     name="tsmakers",
     version="0.1dev",
     packages=["tsmakers"],
     install_requires=install_requires,
+    extras_require=extras_require,
     license="Creative Commons Attribution-Noncommercial-Sharalike license",
     long_description=open("README.md").read(),
 )
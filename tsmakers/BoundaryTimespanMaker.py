@@ -4,8 +4,11 @@ import abjad
 from abjadext import rmakers
 
 from .Cursor import Cursor
+from .IndexedTimespanList import IndexedTimespanList
 from .PerformedTimespan import PerformedTimespan
 from .SilentTimespan import SilentTimespan
+from .sorting import _get_sort_key
+from .TimespanIntervalTree import TimespanIntervalTree
 from .TimespanMaker import TimespanMaker
 
 
@@ -122,6 +125,25 @@ class BoundaryTimespanMaker(TimespanMaker):
                     ]
                 )
 
+    ..  container:: example
+
+        Tick mode makes the same timespans with integer offset arithmetic,
+        counting preexisting offsets in ticks too:
+
+        >>> timespans = timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ...     timespan_list=abjad.TimespanList(timespan_list),
+        ... )
+        >>> tick_timespan_maker = abjad.new(timespan_maker, tick_mode=True)
+        >>> tick_timespans = tick_timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ...     timespan_list=abjad.TimespanList(timespan_list),
+        ... )
+        >>> format(tick_timespans) == format(timespans)
+        True
+
     """
 
     ### CLASS VARIABLES ###
@@ -151,6 +173,7 @@ class BoundaryTimespanMaker(TimespanMaker):
         division_masks=None,
         padding=None,
         seed=None,
+        tick_mode=None,
         timespan_specifier=None,
         voice_names=None,
     ):
@@ -159,6 +182,7 @@ class BoundaryTimespanMaker(TimespanMaker):
             division_masks=division_masks,
             padding=padding,
             seed=seed,
+            tick_mode=tick_mode,
             timespan_specifier=timespan_specifier,
         )
 
@@ -229,7 +253,12 @@ class BoundaryTimespanMaker(TimespanMaker):
         timespan_list=None,
     ):
 
-        preexisting_timespans = abjad.TimespanList()
+        if isinstance(timespan_list, IndexedTimespanList):
+            timespan_list = timespan_list.find(
+                labels=self.labels or None,
+                voice_names=self.voice_names or None,
+            )
+        preexisting_timespans = TimespanIntervalTree()
         for timespan in timespan_list:
             assert isinstance(
                 timespan,
@@ -252,7 +281,7 @@ class BoundaryTimespanMaker(TimespanMaker):
                         break
             else:
                 preexisting_timespans.append(timespan)
-        preexisting_timespans & target_timespan
+        preexisting_timespans.intersect(target_timespan)
         return preexisting_timespans
 
     def _make_timespans(
@@ -288,32 +317,36 @@ class BoundaryTimespanMaker(TimespanMaker):
         stop_groupings = Cursor(stop_groupings)
 
         if self.seed:
-            if self.seed < 0:
-                for _ in range(abs(self.seed)):
-                    start_talea.backtrack()
-                    start_groupings.backtrack()
-                    stop_talea.backtrack()
-                    stop_groupings.backtrack()
-            else:
-                next(start_talea)
-                next(start_groupings)
-                next(stop_talea)
-                next(stop_groupings)
+            # A positive seed advances each cursor by one item only.
+            count = self.seed if self.seed < 0 else 1
+            for cursor in (start_talea, start_groupings, stop_talea, stop_groupings):
+                cursor.advance(count)
 
         context_counter = collections.Counter()
         preexisting_timespans = self._collect_preexisting_timespans(
             target_timespan=target_timespan,
             timespan_list=timespan_list,
         )
+        denominator = None
+        if self.tick_mode:
+            values = [_.start_offset for _ in preexisting_timespans]
+            values.extend(_.stop_offset for _ in preexisting_timespans)
+            values.extend(start_talea.sequence)
+            values.extend(stop_talea.sequence)
+            denominator = self._get_tick_denominator(values)
+            start_talea = self._to_tick_cursor(start_talea, denominator)
+            stop_talea = self._to_tick_cursor(stop_talea, denominator)
         new_timespan_mapping = {}
         for group_index, group in enumerate(preexisting_timespans.partition(True)):
             for context_name, music_specifier in music_specifiers.items():
                 if context_name not in new_timespan_mapping:
                     continue
-                new_timespan_mapping[context_name] - group.timespan
+                self._subtract_timespan(
+                    new_timespan_mapping[context_name], group.timespan
+                )
             for context_name, music_specifier in music_specifiers.items():
                 if context_name not in new_timespan_mapping:
-                    new_timespan_mapping[context_name] = abjad.TimespanList()
+                    new_timespan_mapping[context_name] = []
                 context_seed = context_counter[context_name]
                 start_durations = []
                 for _ in range(next(start_groupings)):
@@ -324,6 +357,8 @@ class BoundaryTimespanMaker(TimespanMaker):
                 start_timespans, stop_timespans = (), ()
                 if start_durations:
                     group_start = group.start_offset
+                    if denominator is not None:
+                        group_start = self._to_ticks(group_start, denominator)
                     if self.start_anchor is abjad.Right:
                         # print('!!!', float(group_start), float(group_start -
                         #    sum(start_durations)))
@@ -331,6 +366,7 @@ class BoundaryTimespanMaker(TimespanMaker):
                     start_timespans = music_specifier(
                         durations=start_durations,
                         layer=layer,
+                        denominator=denominator,
                         division_masks=self.division_masks,
                         padding=self.padding,
                         seed=context_seed,
@@ -341,11 +377,14 @@ class BoundaryTimespanMaker(TimespanMaker):
                     context_counter[context_name] += 1
                 if stop_durations:
                     group_stop = group.stop_offset
+                    if denominator is not None:
+                        group_stop = self._to_ticks(group_stop, denominator)
                     if self.stop_anchor is abjad.Right:
                         group_stop -= sum(stop_durations)
                     stop_timespans = music_specifier(
                         durations=stop_durations,
                         layer=layer,
+                        denominator=denominator,
                         division_masks=self.division_masks,
                         padding=self.padding,
                         seed=context_seed,
@@ -359,10 +398,41 @@ class BoundaryTimespanMaker(TimespanMaker):
                 new_timespan_mapping[context_name].extend(start_timespans)
                 new_timespan_mapping[context_name].extend(stop_timespans)
         for context_name, timespans in new_timespan_mapping.items():
+            timespans = abjad.TimespanList(timespans)
             timespans.compute_logical_or()
             new_timespans.extend(timespans)
         return new_timespans
 
+    @staticmethod
+    def _subtract_timespan(timespans, timespan):
+        # Same as ``timespans - timespan`` on a timespan list, but only
+        # timespans which intersect ``timespan`` are cut, and the others are
+        # kept as they are instead of being deep-copied.
+        start_offset, stop_offset = _get_sort_key(timespan)[:2]
+        new_timespans, keys = [], []
+        for timespan_ in timespans:
+            start_offset_, stop_offset_ = _get_sort_key(timespan_)[:2]
+            if (start_offset <= start_offset_ < stop_offset) or (
+                start_offset_ <= start_offset < stop_offset_
+            ):
+                pieces = timespan_ - timespan
+            else:
+                pieces = [timespan_]
+            new_timespans.extend(pieces)
+            keys.extend(_get_sort_key(_) for _ in pieces)
+        # sorted() keeps a list in which no timespan is less than the one
+        # before it as it is. Performed timespans compare by offsets and
+        # voice name, silent timespans by offsets alone.
+        for i in range(1, len(keys)):
+            if isinstance(new_timespans[i], PerformedTimespan):
+                is_less = keys[i] < keys[i - 1]
+            else:
+                is_less = keys[i][:2] < keys[i - 1][:2]
+            if is_less:
+                new_timespans.sort()
+                break
+        timespans[:] = new_timespans
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -178,6 +178,18 @@ class CascadingTimespanMaker(TimespanMaker):
                     ]
                 )
 
+    ..  container:: example
+
+        Tick mode makes the same timespans with integer offset arithmetic:
+
+        >>> tick_timespan_maker = abjad.new(timespan_maker, tick_mode=True)
+        >>> tick_timespan_list = tick_timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ... )
+        >>> format(tick_timespan_list) == format(timespan_list)
+        True
+
     """
 
     ### CLASS VARIABLES ###
@@ -210,6 +222,7 @@ class CascadingTimespanMaker(TimespanMaker):
             counts=[4],
             denominator=16,
         ),
+        tick_mode=None,
         timespan_specifier=None,
     ):
         TimespanMaker.__init__(
@@ -217,6 +230,7 @@ class CascadingTimespanMaker(TimespanMaker):
             division_masks=division_masks,
             padding=padding,
             seed=seed,
+            tick_mode=tick_mode,
             timespan_specifier=timespan_specifier,
         )
         self._initialize_cascade_pattern(cascade_pattern)
@@ -276,18 +290,26 @@ class CascadingTimespanMaker(TimespanMaker):
         context_names = abjad.CyclicTuple(music_specifiers)
         context_index = self.seed or 0
         cascade_pattern = self.cascade_pattern
-        playing_talea = Cursor(self.playing_talea)
-        playing_groupings = Cursor(self.playing_groupings)
-        silence_talea = Cursor(self.silence_talea)
+        index = None
         if self.seed is not None and 0 < self.seed:
-            for _ in range(self.seed):
-                next(playing_talea)
-                next(playing_groupings)
-                next(silence_talea)
+            index = self.seed
+        playing_talea = Cursor(self.playing_talea, index=index)
+        playing_groupings = Cursor(self.playing_groupings, index=index)
+        silence_talea = Cursor(self.silence_talea, index=index)
         context_seeds = collections.Counter()
         timespan_list = abjad.TimespanList()
         start_offset = target_timespan.start_offset
         stop_offset = target_timespan.stop_offset
+        denominator = None
+        if self.tick_mode:
+            values = [start_offset, stop_offset]
+            values.extend(playing_talea.sequence)
+            values.extend(silence_talea.sequence)
+            denominator = self._get_tick_denominator(values)
+            playing_talea = self._to_tick_cursor(playing_talea, denominator)
+            silence_talea = self._to_tick_cursor(silence_talea, denominator)
+            start_offset = self._to_ticks(start_offset, denominator)
+            stop_offset = self._to_ticks(stop_offset, denominator)
         can_continue = True
         division_mask_seed = 0
         # start the engine
@@ -309,6 +331,7 @@ class CascadingTimespanMaker(TimespanMaker):
                 new_timespans = music_specifier(
                     durations=valid_durations,
                     layer=layer,
+                    denominator=denominator,
                     division_masks=self.division_masks,
                     padding=self.padding,
                     seed=context_seeds[context_name],
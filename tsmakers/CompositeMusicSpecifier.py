@@ -4,6 +4,7 @@ import abjad
 
 from .HashCachingObject import HashCachingObject
 from .MusicSpecifierSequence import MusicSpecifierSequence
+from .sorting import sort_timespans
 
 
 class CompositeMusicSpecifier(HashCachingObject):
@@ -269,6 +270,7 @@ class CompositeMusicSpecifier(HashCachingObject):
         self,
         durations=None,
         layer=None,
+        denominator=None,
         division_masks=None,
         division_mask_seed=None,
         padding=None,
@@ -293,6 +295,7 @@ class CompositeMusicSpecifier(HashCachingObject):
         primary_timespans = self.primary_music_specifier(
             durations=primary_durations,
             layer=layer,
+            denominator=denominator,
             division_masks=division_masks,
             division_mask_seed=division_mask_seed,
             padding=padding,
@@ -304,6 +307,7 @@ class CompositeMusicSpecifier(HashCachingObject):
         secondary_timespans = self.secondary_music_specifier(
             durations=secondary_durations,
             layer=layer,
+            denominator=denominator,
             division_masks=division_masks,
             division_mask_seed=division_mask_seed,
             padding=padding,
@@ -314,7 +318,7 @@ class CompositeMusicSpecifier(HashCachingObject):
         )
         timespans = primary_timespans[:] + secondary_timespans[:]
         timespans = abjad.TimespanList(timespans)
-        timespans.sort()
+        sort_timespans(timespans)
         return timespans
 
     ### PUBLIC PROPERTIES ###
@@ -65,17 +65,21 @@ class Cursor(object):
     ### CLASS VARIABLES ###
 
     __slots__ = (
-        "_sequence",
         "_index",
+        "_items",
+        "_sums",
     )
 
     ### INITIALIZER ###
 
     def __init__(self, sequence=(1, 2, 3), index=None):
-        self._sequence = abjad.CyclicTuple(sequence)
         if index is not None:
             index = int(index)
         self._index = index
+        # Talea items are made into durations once, here, and indexed
+        # directly rather than through a cyclic tuple.
+        self._items = tuple(sequence)
+        self._sums = None
 
     def __str__(self):
         return abjad.storage(self)
@@ -94,24 +98,110 @@ class Cursor(object):
 
     ### PUBLIC METHODS ###
 
+    def advance(self, count=1):
+        r"""
+        Advances cursor by ``count`` items.
+
+        ..  container:: example
+
+            >>> cursor = tsmakers.Cursor([1, 2, 3])
+            >>> cursor.advance(3001)
+            >>> next(cursor)
+            2
+
+            >>> cursor.advance(-2)
+            >>> next(cursor)
+            1
+
+        Same as calling ``next()`` ``count`` times, or ``backtrack()``
+        ``-count`` times when ``count`` is negative, in constant time.
+        """
+        if not self._items or not count:
+            return
+        if self._index is None:
+            self._index = 0
+        self._index += int(count)
+
     def backtrack(self):
-        if not self._sequence:
+        if not self._items:
             return
         if self._index is None:
             self._index = 0
         self._index -= 1
         index = self._index
-        return self._sequence[index]
+        return self._items[index % len(self._items)]
 
     def next(self):
-        if not self._sequence:
+        if not self._items:
             return
         if self._index is None:
             self._index = 1
-            return self._sequence[0]
+            return self._items[0]
         index = self._index
         self._index += 1
-        return self._sequence[index]
+        return self._items[index % len(self._items)]
+
+    def take(self, count):
+        r"""
+        Takes next ``count`` items.
+
+        ..  container:: example
+
+            >>> cursor = tsmakers.Cursor([1, 2, 3])
+            >>> cursor.take(5)
+            (1, 2, 3, 1, 2)
+
+            >>> cursor.take(2)
+            (3, 1)
+
+            >>> next(cursor)
+            2
+
+        Same as calling ``next()`` ``count`` times, with one slice per
+        period.
+        """
+        assert 0 <= count, repr(count)
+        if not self._items or not count:
+            return ()
+        if self._index is None:
+            self._index = 0
+        length = len(self._items)
+        start = self._index % length
+        self._index += count
+        stop = start + count
+        if stop <= length:
+            return self._items[start:stop]
+        periods, stop = divmod(stop, length)
+        return self._items[start:] + self._items * (periods - 1) + self._items[:stop]
+
+    def sum_next(self, count):
+        r"""
+        Sums next ``count`` items without advancing cursor.
+
+        ..  container:: example
+
+            >>> talea = abjadext.rmakers.Talea(
+            ...    counts=(2, 1, 3),
+            ...    denominator=16,
+            ...    )
+            >>> cursor = tsmakers.Cursor(talea, index=2)
+            >>> cursor.sum_next(7)
+            Duration(15, 16)
+
+            >>> sum(next(cursor) for _ in range(7))
+            Duration(15, 16)
+
+        Runs in constant time, from sums over one period of the sequence.
+        """
+        assert 0 <= count, repr(count)
+        if not self._items:
+            return 0
+        if self._sums is None:
+            self._sums = tuple(abjad.math.cumulative_sums(self._items, start=0))
+        length = len(self._items)
+        start = (self._index or 0) % length
+        periods, stop = divmod(start + count, length)
+        return periods * self._sums[-1] + self._sums[stop] - self._sums[start]
 
     ### PUBLIC PROPERTIES ###
 
@@ -121,4 +211,4 @@ class Cursor(object):
 
     @property
     def sequence(self):
-        return self._sequence
+        return abjad.CyclicTuple(self._items)
@@ -2,7 +2,10 @@ import collections
 
 import abjad
 
+from .IndexedTimespanList import IndexedTimespanList
 from .PerformedTimespan import PerformedTimespan
+from .sorting import sort_timespans
+from .TimespanIntervalTree import TimespanIntervalTree
 from .TimespanMaker import TimespanMaker
 
 
@@ -109,6 +112,25 @@ class DependentTimespanMaker(TimespanMaker):
                     ]
                 )
 
+    ..  container:: example
+
+        Tick mode makes the same timespans with integer offset arithmetic,
+        counting preexisting offsets in ticks too:
+
+        >>> timespans = timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ...     timespan_list=abjad.TimespanList(timespan_list),
+        ... )
+        >>> tick_timespan_maker = abjad.new(timespan_maker, tick_mode=True)
+        >>> tick_timespans = tick_timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ...     timespan_list=abjad.TimespanList(timespan_list),
+        ... )
+        >>> format(tick_timespans) == format(timespans)
+        True
+
     """
 
     ### CLASS VARIABLES ###
@@ -136,6 +158,7 @@ class DependentTimespanMaker(TimespanMaker):
         padding=None,
         rotation_indices=None,
         seed=None,
+        tick_mode=None,
         timespan_specifier=None,
         voice_names=None,
     ):
@@ -144,6 +167,7 @@ class DependentTimespanMaker(TimespanMaker):
             division_masks=division_masks,
             padding=padding,
             seed=seed,
+            tick_mode=tick_mode,
             timespan_specifier=timespan_specifier,
         )
         if hysteresis is not None:
@@ -181,7 +205,12 @@ class DependentTimespanMaker(TimespanMaker):
         target_timespan=None,
         timespan_list=None,
     ):
-        preexisting_timespans = abjad.TimespanList()
+        if isinstance(timespan_list, IndexedTimespanList):
+            timespan_list = timespan_list.find(
+                labels=self.labels or None,
+                voice_names=self.voice_names or None,
+            )
+        preexisting_timespans = TimespanIntervalTree()
         for timespan in timespan_list:
             if not isinstance(timespan, PerformedTimespan):
                 continue
@@ -208,7 +237,7 @@ class DependentTimespanMaker(TimespanMaker):
                     division_timespan = abjad.get.timespan(division)
                     division_timespan = division_timespan.translate(outer_start_offset)
                     preexisting_timespans.append(division_timespan)
-        preexisting_timespans & target_timespan
+        preexisting_timespans.intersect(target_timespan)
         return preexisting_timespans
 
     def _partition_preexisting_timespans(self, timespans):
@@ -224,7 +253,7 @@ class DependentTimespanMaker(TimespanMaker):
                 coalesced_shards.append(shard)
             else:
                 coalesced_shards[-1].extend(shard)
-                coalesced_shards[-1].sort()
+                sort_timespans(coalesced_shards[-1])
         return coalesced_shards
 
     def _make_timespans(
@@ -247,6 +276,11 @@ class DependentTimespanMaker(TimespanMaker):
         partitioned_timespans = self._partition_preexisting_timespans(
             preexisting_timespans
         )
+        denominator = None
+        if self.tick_mode:
+            values = [_.start_offset for _ in preexisting_timespans]
+            values.extend(_.stop_offset for _ in preexisting_timespans)
+            denominator = self._get_tick_denominator(values)
         for group_index, group in enumerate(partitioned_timespans):
             rotation_index = rotation_indices[group_index]
             offsets = set()
@@ -257,6 +291,8 @@ class DependentTimespanMaker(TimespanMaker):
                     offsets.add(timespan.start_offset)
                 if self.include_inner_stops:
                     offsets.add(timespan.stop_offset)
+            if denominator is not None:
+                offsets = set(self._to_ticks(_, denominator) for _ in offsets)
             offsets = tuple(sorted(offsets))
             durations = abjad.Sequence(abjad.math.difference_series(offsets))
             durations = durations.rotate(rotation_index)
@@ -266,6 +302,7 @@ class DependentTimespanMaker(TimespanMaker):
                 timespans = music_specifier(
                     durations=durations,
                     layer=layer,
+                    denominator=denominator,
                     division_masks=self.division_masks,
                     padding=self.padding,
                     seed=context_seed,
@@ -105,6 +105,18 @@ class FloodedTimespanMaker(TimespanMaker):
                     ]
                 )
 
+    ..  container:: example
+
+        Tick mode makes the same timespans with integer offset arithmetic:
+
+        >>> tick_timespan_maker = abjad.new(timespan_maker, tick_mode=True)
+        >>> tick_timespan_list = tick_timespan_maker(
+        ...     music_specifiers=music_specifiers,
+        ...     target_timespan=target_timespan,
+        ... )
+        >>> format(tick_timespan_list) == format(timespan_list)
+        True
+
     """
 
     ### CLASS VARIABLES ###
@@ -118,6 +130,7 @@ class FloodedTimespanMaker(TimespanMaker):
         division_masks=None,
         padding=None,
         seed=None,
+        tick_mode=None,
         timespan_specifier=None,
     ):
         TimespanMaker.__init__(
@@ -125,6 +138,7 @@ class FloodedTimespanMaker(TimespanMaker):
             division_masks=division_masks,
             padding=padding,
             seed=seed,
+            tick_mode=tick_mode,
             timespan_specifier=timespan_specifier,
         )
 
@@ -139,11 +153,17 @@ class FloodedTimespanMaker(TimespanMaker):
     ):
         start_offset = target_timespan.start_offset
         durations = [target_timespan.duration]
+        denominator = None
+        if self.tick_mode:
+            denominator = self._get_tick_denominator(durations + [start_offset])
+            start_offset = self._to_ticks(start_offset, denominator)
+            durations = [self._to_ticks(_, denominator) for _ in durations]
         new_timespans = abjad.TimespanList()
         for context_name, music_specifier in music_specifiers.items():
             timespans = music_specifier(
                 durations=durations,
                 layer=layer,
+                denominator=denominator,
                 division_masks=self.division_masks,
                 padding=self.padding,
                 seed=self.seed,
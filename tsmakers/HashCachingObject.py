@@ -1,20 +1,69 @@
+import collections
+import numbers
+import types
+import weakref
+
 import abjad
 
 
 class HashCachingObject(object):
+    r"""
+    An object which caches its hash and storage format.
+
+    Equality and hashing use an identity key made of the object's type and
+    the values in its storage format template, so comparing two objects
+    does not render their storage formats. Nested hash-caching objects reuse
+    their own cached keys.
+
+    ..  container:: example
+
+        >>> specifier_one = tsmakers.MusicSpecifier(labels="flute", seed=1)
+        >>> specifier_two = tsmakers.MusicSpecifier(labels=["flute"], seed=1)
+        >>> specifier_one == specifier_two
+        True
+
+        >>> hash(specifier_one) == hash(specifier_two)
+        True
+
+        >>> specifier_one == specifier_two.rotate(1)
+        False
+
+    ..  container:: example
+
+        Equal objects can be interned, so that they share one instance:
+
+        >>> specifier_one.intern() is specifier_two.intern()
+        True
+
+    Music specifier sequences intern the specifiers they hold when made,
+    and timespan makers intern composite music specifiers when called.
+
+    Derived objects, like rotated music specifiers, are cached by the
+    identity keys of their source and argument. The cache holds its 1024
+    most recently used results strongly, so they stay alive while cached.
+    """
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "__weakref__",
         "_format",
         "_hash",
+        "_key",
     )
 
+    _derivation_cache_size = 1024
+
+    _derivations = collections.OrderedDict()
+
+    _interned = weakref.WeakValueDictionary()
+
     ### INITIALIZER ###
 
     def __init__(self):
         self._format = None
         self._hash = None
+        self._key = None
 
     def __str__(self):
         return abjad.storage(self)
@@ -26,8 +75,10 @@ class HashCachingObject(object):
 
     # @profile
     def __eq__(self, expr):
+        if expr is self:
+            return True
         if isinstance(expr, type(self)):
-            if format(self) == format(expr):
+            if self._get_identity_key() == expr._get_identity_key():
                 return True
         return False
 
@@ -41,5 +92,80 @@ class HashCachingObject(object):
     # @profile
     def __hash__(self):
         if self._hash is None:
-            self._hash = hash((type(self), format(self)))
+            self._hash = hash(self._get_identity_key())
         return self._hash
+
+    ### PRIVATE METHODS ###
+
+    def _derive(self, name, argument, function):
+        # Keys on identity keys, so 1, 1.0 and True make different entries.
+        try:
+            key = (
+                self._get_identity_key(),
+                name,
+                HashCachingObject._make_identity_key(argument),
+            )
+            hash(key)
+        except TypeError:
+            return function().intern()
+        derivations = HashCachingObject._derivations
+        if key in derivations:
+            derivations.move_to_end(key)
+            return derivations[key]
+        result = function().intern()
+        derivations[key] = result
+        if self._derivation_cache_size < len(derivations):
+            derivations.popitem(last=False)
+        return result
+
+    def _get_identity_key(self):
+        if self._key is None:
+            agent = abjad.StorageFormatManager(self)
+            self._key = (type(self),) + tuple(
+                (name, HashCachingObject._make_identity_key(value))
+                for name, value in agent.get_template_dict().items()
+            )
+        return self._key
+
+    @staticmethod
+    def _make_identity_key(value):
+        make_key = HashCachingObject._make_identity_key
+        if isinstance(value, HashCachingObject):
+            return value._get_identity_key()
+        if value is None or isinstance(value, (numbers.Number, str)):
+            return (type(value), value)
+        if isinstance(
+            value,
+            (type, types.BuiltinFunctionType, types.FunctionType, types.MethodType),
+        ):
+            return value
+        if isinstance(value, collections.abc.Mapping):
+            return (type(value),) + tuple(
+                (make_key(key), make_key(value[key])) for key in value
+            )
+        if isinstance(value, (collections.abc.Set)):
+            return (type(value), frozenset(make_key(_) for _ in value))
+        if isinstance(value, collections.abc.Sequence):
+            return (type(value),) + tuple(make_key(_) for _ in value)
+        agent = abjad.StorageFormatManager(value)
+        return (type(value),) + tuple(
+            (name, make_key(value_))
+            for name, value_ in agent.get_template_dict().items()
+        )
+
+    ### PUBLIC METHODS ###
+
+    def intern(self):
+        r"""
+        Interns object.
+
+        Returns the interned object equal to this one, or interns this
+        object if there is none. Interned objects are held weakly, but
+        derived objects are also held by the derivation cache.
+        """
+        key = self._get_identity_key()
+        try:
+            return HashCachingObject._interned[key]
+        except KeyError:
+            HashCachingObject._interned[key] = self
+            return self
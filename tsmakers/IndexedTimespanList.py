@@ -0,0 +1,184 @@
+import abjad
+
+
+class IndexedTimespanList(abjad.TimespanList):
+    r"""
+    An indexed timespan list.
+
+    Keeps maps from voice names and music specifier labels to the timespans
+    which carry them, updated as timespans are added and removed, so
+    dependent timespan makers find their source timespans without scanning
+    the whole list.
+
+    ..  container:: example
+
+        >>> timespans = tsmakers.IndexedTimespanList(
+        ...     [
+        ...         tsmakers.PerformedTimespan(
+        ...             start_offset=0,
+        ...             stop_offset=1,
+        ...             music_specifier=tsmakers.MusicSpecifier(labels="loud"),
+        ...             voice_name="Violin",
+        ...         ),
+        ...         tsmakers.PerformedTimespan(
+        ...             start_offset=0,
+        ...             stop_offset=2,
+        ...             music_specifier=tsmakers.MusicSpecifier(labels="soft"),
+        ...             voice_name="Cello",
+        ...         ),
+        ...         tsmakers.SilentTimespan(
+        ...             start_offset=1,
+        ...             stop_offset=2,
+        ...             voice_name="Violin",
+        ...         ),
+        ...     ]
+        ... )
+        >>> for timespan in timespans.find(voice_names=["Violin"]):
+        ...     type(timespan).__name__, timespan.start_offset
+        ...
+        ('PerformedTimespan', Offset((0, 1)))
+        ('SilentTimespan', Offset((1, 1)))
+
+        >>> for timespan in timespans.find(labels=["soft"]):
+        ...     timespan.voice_name
+        ...
+        'Cello'
+
+        >>> timespans.find(labels=["soft"], voice_names=["Violin"])
+        []
+
+    ..  container:: example
+
+        The maps follow changes to the list:
+
+        >>> _ = timespans - abjad.Timespan(0, 2)
+        >>> timespans.find(voice_names=["Violin", "Cello"])
+        []
+
+    ..  container:: example
+
+        Timespan makers use the maps when given an indexed timespan list:
+
+        >>> timespan_maker = tsmakers.DependentTimespanMaker(
+        ...     labels=["loud"],
+        ... )
+        >>> timespans = tsmakers.IndexedTimespanList(
+        ...     [
+        ...         tsmakers.PerformedTimespan(
+        ...             start_offset=0,
+        ...             stop_offset=1,
+        ...             music_specifier=tsmakers.MusicSpecifier(labels="loud"),
+        ...             voice_name="Violin",
+        ...         ),
+        ...     ]
+        ... )
+        >>> timespans = timespan_maker(
+        ...     music_specifiers={"Viola": None},
+        ...     target_timespan=abjad.Timespan(0, 4),
+        ...     timespan_list=timespans,
+        ... )
+        >>> [_.voice_name for _ in timespans.find(voice_names=["Viola"])]
+        ['Viola']
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_counts",
+        "_label_index",
+        "_voice_name_index",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None, item_class=None, keep_sorted=False):
+        self._counts = {}
+        self._label_index = {}
+        self._voice_name_index = {}
+        abjad.TimespanList.__init__(
+            self,
+            items=items,
+            item_class=item_class,
+            keep_sorted=keep_sorted,
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __delitem__(self, i):
+        r"""
+        Deletes item or slice ``i``.
+        """
+        if isinstance(i, slice):
+            for item in self._collection[i]:
+                self._on_removal(item)
+            del self._collection[i]
+        else:
+            abjad.TimespanList.__delitem__(self, i)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_labels(timespan):
+        music_specifier = getattr(timespan, "music_specifier", None)
+        return getattr(music_specifier, "labels", None) or ()
+
+    @staticmethod
+    def _gather(index, keys):
+        timespans = {}
+        for key in keys:
+            timespans.update(index.get(key, {}))
+        return timespans
+
+    def _on_insertion(self, item):
+        key = id(item)
+        if key in self._counts:
+            self._counts[key] += 1
+            return
+        self._counts[key] = 1
+        voice_name = getattr(item, "voice_name", None)
+        self._voice_name_index.setdefault(voice_name, {})[key] = item
+        for label in self._get_labels(item):
+            self._label_index.setdefault(label, {})[key] = item
+
+    def _on_removal(self, item):
+        key = id(item)
+        self._counts[key] -= 1
+        if self._counts[key]:
+            return
+        del self._counts[key]
+        voice_name = getattr(item, "voice_name", None)
+        del self._voice_name_index[voice_name][key]
+        for label in self._get_labels(item):
+            self._label_index[label].pop(key, None)
+
+    ### PUBLIC METHODS ###
+
+    def find(self, labels=None, voice_names=None):
+        r"""
+        Finds timespans in any of ``voice_names`` whose music specifier
+        carries any of ``labels``.
+
+        Either condition is skipped when none. Labels are read from each
+        timespan when it is added to the list.
+
+        Returns list.
+        """
+        timespans = None
+        if voice_names is not None:
+            timespans = self._gather(self._voice_name_index, voice_names)
+        if labels is not None:
+            labeled_timespans = self._gather(self._label_index, labels)
+            if timespans is None:
+                timespans = labeled_timespans
+            else:
+                if len(labeled_timespans) < len(timespans):
+                    timespans, labeled_timespans = labeled_timespans, timespans
+                timespans = {
+                    key: timespan
+                    for key, timespan in timespans.items()
+                    if key in labeled_timespans
+                }
+        if timespans is None:
+            return list(self)
+        return list(timespans.values())
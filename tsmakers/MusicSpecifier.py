@@ -97,12 +97,45 @@ class MusicSpecifier(HashCachingObject):
     def __repr__(self):
         return abjad.storage(self)
 
+    ### PRIVATE METHODS ###
+
+    def _transpose(self, expr):
+        if isinstance(expr, str):
+            try:
+                pitch = abjad.NamedPitch(expr)
+                expr = abjad.NamedPitch("C4") - pitch
+            except Exception:
+                expr = abjad.NamedInterval(expr)
+        pitch_handler = self.pitch_handler
+        if pitch_handler is not None:
+            pitch_handler = pitch_handler.transpose(expr)
+        return abjad.new(
+            self,
+            pitch_handler=pitch_handler,
+        )
+
     ### PUBLIC METHODS ###
 
     def rotate(self, rotation):
+        r"""
+        Rotates music specifier.
+
+        ..  container:: example
+
+            >>> music_specifier = tsmakers.MusicSpecifier(seed=1)
+            >>> print(abjad.storage(music_specifier.rotate(2)))
+            tsmakers.MusicSpecifier(
+                seed=3,
+                )
+
+            >>> music_specifier.rotate(2) is music_specifier.rotate(2)
+            True
+
+        Returns new music specifier. Equal results are shared.
+        """
         seed = self.seed or 0
         seed = seed + rotation
-        return abjad.new(self, seed=seed)
+        return self._derive("rotate", rotation, lambda: abjad.new(self, seed=seed))
 
     def transpose(self, expr):
         r"""
@@ -115,21 +148,9 @@ class MusicSpecifier(HashCachingObject):
             >>> print(abjad.storage(transposed_music_specifier))
             tsmakers.MusicSpecifier()
 
-        Returns new music specifier.
+        Returns new music specifier. Equal results are shared.
         """
-        if isinstance(expr, str):
-            try:
-                pitch = abjad.NamedPitch(expr)
-                expr = abjad.NamedPitch("C4") - pitch
-            except Exception:
-                expr = abjad.NamedInterval(expr)
-        pitch_handler = self.pitch_handler
-        if pitch_handler is not None:
-            pitch_handler = pitch_handler.transpose(expr)
-        return abjad.new(
-            self,
-            pitch_handler=pitch_handler,
-        )
+        return self._derive("transpose", expr, lambda: self._transpose(expr))
 
     ### PUBLIC PROPERTIES ###
 
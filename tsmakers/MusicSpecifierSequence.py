@@ -4,6 +4,8 @@ import abjad
 import tsmakers
 from abjadext import rmakers
 
+from .HashCachingObject import HashCachingObject
+
 
 class MusicSpecifierSequence(object):
     r"""
@@ -56,7 +58,10 @@ class MusicSpecifierSequence(object):
             music_specifiers, str
         ):
             music_specifiers = [music_specifiers]
-        music_specifiers = tuple(music_specifiers)
+        music_specifiers = tuple(
+            _.intern() if isinstance(_, HashCachingObject) else _
+            for _ in music_specifiers
+        )
         # music_specifiers = abjad.CyclicTuple(music_specifiers)
         assert len(music_specifiers)
         self._application_rate = application_rate
@@ -74,6 +79,7 @@ class MusicSpecifierSequence(object):
         self,
         durations=None,
         layer=None,
+        denominator=None,
         division_mask_seed=0,
         division_masks=None,
         padding=None,
@@ -90,23 +96,27 @@ class MusicSpecifierSequence(object):
         offsets = abjad.math.cumulative_sums(durations, start_offset)
         if not offsets:
             return timespans
+        if denominator is not None:
+            # Durations and start offset are ticks of ``1 / denominator``.
+            offsets = [abjad.Offset(_, denominator) for _ in offsets]
         offset_pair_count = len(offsets) - 1
         if offset_pair_count == 1:
             offset_pair_count = 2  # make patterns happy
-        iterator = abjad.Sequence(offsets).nwise()
-        for i, offset_pair in enumerate(iterator):
-            start_offset, stop_offset = offset_pair
-            music_specifier = self[seed % len(self)]
-            timespan = tsmakers.PerformedTimespan(
-                forbid_fusing=timespan_specifier.forbid_fusing,
-                forbid_splitting=timespan_specifier.forbid_splitting,
-                layer=layer,
-                minimum_duration=timespan_specifier.minimum_duration,
-                music_specifier=music_specifier,
-                start_offset=start_offset,
-                stop_offset=stop_offset,
-                voice_name=voice_name,
-            )
+        music_specifiers = []
+        for i in range(len(offsets) - 1):
+            music_specifiers.append(self[seed % len(self)])
+            if self.application_rate == "division":
+                seed += 1
+        performed_timespans = tsmakers.PerformedTimespan.from_offsets(
+            offsets,
+            forbid_fusing=timespan_specifier.forbid_fusing,
+            forbid_splitting=timespan_specifier.forbid_splitting,
+            layer=layer,
+            minimum_duration=timespan_specifier.minimum_duration,
+            music_specifiers=music_specifiers,
+            voice_name=voice_name,
+        )
+        for i, timespan in enumerate(performed_timespans):
             if not division_masks:
                 timespans.append(timespan)
             else:
@@ -120,8 +130,6 @@ class MusicSpecifierSequence(object):
                 elif isinstance(output_mask, rmakers.SilenceMask):
                     pass
             division_mask_seed += 1
-            if self.application_rate == "division":
-                seed += 1
 
         if padding:
             silent_timespans = abjad.TimespanList()
@@ -141,10 +149,11 @@ class MusicSpecifierSequence(object):
                 )
                 silent_timespans.append(silent_timespan_two)
             silent_timespans.compute_logical_or()
+            silent_timespans = tsmakers.TimespanIntervalTree(silent_timespans)
             for timespan in timespans:
-                silent_timespans - timespan
+                silent_timespans.subtract(timespan)
             timespans.extend(silent_timespans)
-            timespans.sort()
+            tsmakers.sort_timespans(timespans)
 
         return timespans
 
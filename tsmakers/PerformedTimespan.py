@@ -1,5 +1,8 @@
 import abjad
 
+from .construction import new_timespan
+from .sorting import make_sort_key
+
 
 class PerformedTimespan(abjad.Timespan):
     r"""A Performed timespan.
@@ -27,6 +30,7 @@ class PerformedTimespan(abjad.Timespan):
         "_music_specifier",
         "_original_start_offset",
         "_original_stop_offset",
+        "_sort_key",
         "_voice_name",
         "_handler",
     )
@@ -57,38 +61,40 @@ class PerformedTimespan(abjad.Timespan):
         if divisions is not None:
             divisions = tuple(abjad.Duration(_) for _ in divisions)
             assert sum(divisions) == self.duration
-        self._divisions = divisions
         if forbid_fusing is not None:
             forbid_fusing = bool(forbid_fusing)
-        self._forbid_fusing = forbid_fusing
         if forbid_splitting is not None:
             forbid_splitting = bool(forbid_splitting)
-        self._forbid_splitting = forbid_splitting
         if layer is not None:
             layer = int(layer)
-        self._layer = layer
         if minimum_duration is not None:
             minimum_duration = abjad.Duration(minimum_duration)
-        self._minimum_duration = minimum_duration
         # if music is not None:
         #    assert inspect(music).get_duration() == self.duration
-        self._music = music
         # if music_specifier is not None:
         #    assert isinstance(music_specifier, tsmakers.MusicSpecifier), \
         #        music_specifier
-        self._music_specifier = music_specifier
         if original_start_offset is not None:
             original_start_offset = abjad.Offset(original_start_offset)
         else:
             original_start_offset = self.start_offset
-        self._original_start_offset = original_start_offset
         if original_stop_offset is not None:
             original_stop_offset = abjad.Offset(original_stop_offset)
         else:
             original_stop_offset = self.stop_offset
-        self._original_stop_offset = original_stop_offset
-        self._voice_name = voice_name
-        self._handler = handler
+        self._initialize(
+            divisions,
+            forbid_fusing,
+            forbid_splitting,
+            layer,
+            minimum_duration,
+            music,
+            music_specifier,
+            original_start_offset,
+            original_stop_offset,
+            voice_name,
+            handler,
+        )
 
     def __str__(self):
         return abjad.storage(self)
@@ -134,6 +140,34 @@ class PerformedTimespan(abjad.Timespan):
             ps = ps.show(str(self.layer))
         return ps
 
+    def _initialize(
+        self,
+        divisions,
+        forbid_fusing,
+        forbid_splitting,
+        layer,
+        minimum_duration,
+        music,
+        music_specifier,
+        original_start_offset,
+        original_stop_offset,
+        voice_name,
+        handler,
+    ):
+        # Sets this class's slots from normalized values.
+        self._divisions = divisions
+        self._forbid_fusing = forbid_fusing
+        self._forbid_splitting = forbid_splitting
+        self._layer = layer
+        self._minimum_duration = minimum_duration
+        self._music = music
+        self._music_specifier = music_specifier
+        self._original_start_offset = original_start_offset
+        self._original_stop_offset = original_stop_offset
+        self._sort_key = None
+        self._voice_name = voice_name
+        self._handler = handler
+
     def _get_format_specification(self):
         agent = abjad.StorageFormatManager(self)
         names = agent.signature_keyword_names
@@ -147,6 +181,90 @@ class PerformedTimespan(abjad.Timespan):
 
     ### PUBLIC METHODS ###
 
+    @classmethod
+    def from_offsets(
+        class_,
+        offsets,
+        forbid_fusing=None,
+        forbid_splitting=None,
+        layer=None,
+        minimum_duration=None,
+        music_specifiers=None,
+        voice_name=None,
+        handler=None,
+    ):
+        r"""
+        Makes performed timespans between consecutive ``offsets``.
+
+        ..  container:: example
+
+            >>> timespans = tsmakers.PerformedTimespan.from_offsets(
+            ...     [0, (1, 4), (3, 4)],
+            ...     layer=1,
+            ...     music_specifiers=["A", "B"],
+            ...     voice_name="Violin",
+            ... )
+            >>> for timespan in timespans:
+            ...     print(abjad.storage(timespan))
+            ...
+            tsmakers.PerformedTimespan(
+                start_offset=abjad.Offset((0, 1)),
+                stop_offset=abjad.Offset((1, 4)),
+                layer=1,
+                music_specifier='A',
+                voice_name='Violin',
+                )
+            tsmakers.PerformedTimespan(
+                start_offset=abjad.Offset((1, 4)),
+                stop_offset=abjad.Offset((3, 4)),
+                layer=1,
+                music_specifier='B',
+                voice_name='Violin',
+                )
+
+        Fields shared by all timespans are normalized once per call.
+        ``music_specifiers`` gives one music specifier per timespan, so must
+        be one shorter than ``offsets``.
+
+        Returns list of performed timespans.
+        """
+        if forbid_fusing is not None:
+            forbid_fusing = bool(forbid_fusing)
+        if forbid_splitting is not None:
+            forbid_splitting = bool(forbid_splitting)
+        if layer is not None:
+            layer = int(layer)
+        if minimum_duration is not None:
+            minimum_duration = abjad.Duration(minimum_duration)
+        offsets = [
+            _ if isinstance(_, abjad.Offset) else abjad.Offset(_) for _ in offsets
+        ]
+        if music_specifiers is None:
+            music_specifiers = [None] * (len(offsets) - 1)
+        music_specifiers = list(music_specifiers)
+        assert len(music_specifiers) == len(offsets) - 1, repr(music_specifiers)
+        timespans = []
+        for start_offset, stop_offset, music_specifier in zip(
+            offsets, offsets[1:], music_specifiers
+        ):
+            assert start_offset <= stop_offset, repr((start_offset, stop_offset))
+            timespan = new_timespan(class_, start_offset, stop_offset)
+            timespan._initialize(
+                None,
+                forbid_fusing,
+                forbid_splitting,
+                layer,
+                minimum_duration,
+                None,
+                music_specifier,
+                start_offset,
+                stop_offset,
+                voice_name,
+                handler,
+            )
+            timespans.append(timespan)
+        return timespans
+
     def split_at_offset(self, offset):
         offset = abjad.Offset(offset)
         result = abjad.TimespanList()
@@ -230,6 +348,24 @@ class PerformedTimespan(abjad.Timespan):
     def original_stop_offset(self):
         return self._original_stop_offset
 
+    @property
+    def sort_key(self):
+        r"""
+        Gets sort key of start offset, stop offset and voice name.
+
+        ..  container:: example
+
+            >>> timespan = tsmakers.PerformedTimespan(0, (1, 2), voice_name="Oboe")
+            >>> timespan.sort_key
+            (Fraction(0, 1), Fraction(1, 2), 'Oboe')
+
+        """
+        if self._sort_key is None:
+            self._sort_key = make_sort_key(
+                self._start_offset, self._stop_offset, self._voice_name
+            )
+        return self._sort_key
+
     @property
     def voice_name(self):
         return self._voice_name
@@ -0,0 +1,560 @@
+import array
+import math
+
+import abjad
+import quicktions
+
+from .PerformedTimespan import PerformedTimespan
+from .SilentTimespan import SilentTimespan
+
+
+class PerformedTimespanTable(object):
+    r"""
+    A table of performed and silent timespans.
+
+    Timespans are stored column by column. Offsets are kept as integer
+    numerators and denominators, voice names, layers, music specifiers and
+    handlers as codes into per-column category lists. Other attributes are
+    stored only for the rows which set them. Rows are materialized as
+    ``PerformedTimespan`` or ``SilentTimespan`` objects on access, and
+    slices as tables.
+
+    Offset and code columns are 64-bit integer arrays on every platform. An
+    offset column changes to a list of Python integers when an offset does
+    not fit. Infinite offsets are kept with a zero denominator.
+
+    ..  container:: example
+
+        >>> timespans = [
+        ...     tsmakers.PerformedTimespan(
+        ...         start_offset=0,
+        ...         stop_offset=(3, 2),
+        ...         music_specifier="A",
+        ...         voice_name="Violin",
+        ...     ),
+        ...     tsmakers.SilentTimespan(
+        ...         start_offset=0,
+        ...         stop_offset=(3, 2),
+        ...         voice_name="Cello",
+        ...     ),
+        ...     tsmakers.PerformedTimespan(
+        ...         start_offset=(3, 2),
+        ...         stop_offset=2,
+        ...         divisions=[(1, 4), (1, 4)],
+        ...         music_specifier="A",
+        ...         original_stop_offset=4,
+        ...         voice_name="Violin",
+        ...     ),
+        ... ]
+        >>> table = tsmakers.PerformedTimespanTable(timespans)
+        >>> len(table)
+        3
+
+        >>> list(table) == timespans
+        True
+
+        >>> print(abjad.storage(table[2]))
+        tsmakers.PerformedTimespan(
+            start_offset=abjad.Offset((3, 2)),
+            stop_offset=abjad.Offset((2, 1)),
+            divisions=(
+                abjad.Duration(1, 4),
+                abjad.Duration(1, 4),
+                ),
+            music_specifier='A',
+            original_stop_offset=abjad.Offset((4, 1)),
+            voice_name='Violin',
+            )
+
+        >>> table.voice_names
+        ('Violin', 'Cello')
+
+        >>> table[1:]
+        tsmakers.PerformedTimespanTable(
+            [
+                tsmakers.SilentTimespan(
+                    start_offset=abjad.Offset((0, 1)),
+                    stop_offset=abjad.Offset((3, 2)),
+                    voice_name='Cello',
+                    ),
+                tsmakers.PerformedTimespan(
+                    start_offset=abjad.Offset((3, 2)),
+                    stop_offset=abjad.Offset((2, 1)),
+                    divisions=(
+                        abjad.Duration(1, 4),
+                        abjad.Duration(1, 4),
+                        ),
+                    music_specifier='A',
+                    original_stop_offset=abjad.Offset((4, 1)),
+                    voice_name='Violin',
+                    ),
+                ]
+            )
+
+    ..  container:: example
+
+        Offsets past 32 bits stay in 64-bit columns:
+
+        >>> timespans = [
+        ...     tsmakers.PerformedTimespan(
+        ...         start_offset=(2**40 + 1, 3),
+        ...         stop_offset=2**40,
+        ...         voice_name="Violin",
+        ...     ),
+        ... ]
+        >>> table = tsmakers.PerformedTimespanTable(timespans)
+        >>> list(table) == timespans
+        True
+
+        >>> table._start_numerators, table._codes["voice_name"]
+        (array('q', [1099511627777]), array('q', [0]))
+
+        Offsets of any size and infinite offsets round-trip:
+
+        >>> timespans = [
+        ...     tsmakers.PerformedTimespan(start_offset=(1, 2**70)),
+        ...     tsmakers.SilentTimespan(stop_offset=0),
+        ... ]
+        >>> table = tsmakers.PerformedTimespanTable(timespans)
+        >>> list(table) == timespans
+        True
+
+        >>> table.sort()
+        >>> table.timespan
+        Timespan(NegativeInfinity, Infinity)
+
+    ..  container:: example
+
+        Timespan makers extend tables in place:
+
+        >>> timespan_maker = tsmakers.FloodedTimespanMaker()
+        >>> table = tsmakers.PerformedTimespanTable()
+        >>> table = timespan_maker(
+        ...     music_specifiers={"Violin": None, "Cello": None},
+        ...     target_timespan=abjad.Timespan(0, 2),
+        ...     timespan_list=table,
+        ... )
+        >>> for timespan in table:
+        ...     timespan
+        ...
+        tsmakers.PerformedTimespan(
+            start_offset=abjad.Offset((0, 1)),
+            stop_offset=abjad.Offset((2, 1)),
+            voice_name='Cello',
+            )
+        tsmakers.PerformedTimespan(
+            start_offset=abjad.Offset((0, 1)),
+            stop_offset=abjad.Offset((2, 1)),
+            voice_name='Violin',
+            )
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_categories",
+        "_category_indices",
+        "_codes",
+        "_extras",
+        "_silent",
+        "_start_denominators",
+        "_start_numerators",
+        "_stop_denominators",
+        "_stop_numerators",
+    )
+
+    _categorical_names = ("handler", "layer", "music_specifier", "voice_name")
+
+    _extra_names = (
+        "divisions",
+        "forbid_fusing",
+        "forbid_splitting",
+        "minimum_duration",
+        "music",
+        "original_start_offset",
+        "original_stop_offset",
+    )
+
+    _integer_names = (
+        "_silent",
+        "_start_denominators",
+        "_start_numerators",
+        "_stop_denominators",
+        "_stop_numerators",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        self._categories = {_: [] for _ in self._categorical_names}
+        self._category_indices = {_: {} for _ in self._categorical_names}
+        self._codes = {_: array.array("q") for _ in self._categorical_names}
+        self._extras = {}
+        self._silent = array.array("b")
+        self._start_denominators = array.array("q")
+        self._start_numerators = array.array("q")
+        self._stop_denominators = array.array("q")
+        self._stop_numerators = array.array("q")
+        if timespans is not None:
+            self.extend(timespans)
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            table = type(self)()
+            table._extend_rows(self, range(len(self))[i])
+            return table
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        start_offset = self._decode_offset(
+            self._start_numerators[i], self._start_denominators[i]
+        )
+        stop_offset = self._decode_offset(
+            self._stop_numerators[i], self._stop_denominators[i]
+        )
+        values = {
+            name: self._categories[name][self._codes[name][i]]
+            for name in self._categorical_names
+        }
+        if self._silent[i]:
+            del values["music_specifier"]
+            return SilentTimespan(
+                start_offset=start_offset, stop_offset=stop_offset, **values
+            )
+        values.update(self._extras.get(i, {}))
+        return PerformedTimespan(
+            start_offset=start_offset, stop_offset=stop_offset, **values
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self._silent)
+
+    def __repr__(self):
+        return abjad.storage(self)
+
+    ### PRIVATE METHODS ###
+
+    def _append_integer(self, name, value):
+        try:
+            getattr(self, name).append(value)
+        except OverflowError:
+            self._extend_integers(name, [value])
+
+    @staticmethod
+    def _decode_offset(numerator, denominator):
+        if denominator:
+            return abjad.Offset(numerator, denominator)
+        if numerator < 0:
+            return abjad.NegativeInfinity()
+        return abjad.Infinity()
+
+    def _encode(self, name, value):
+        indices = self._category_indices[name]
+        try:
+            return indices[value]
+        except KeyError:
+            code = indices[value] = len(self._categories[name])
+        except TypeError:
+            for code, category in enumerate(self._categories[name]):
+                if category is value:
+                    return code
+            code = len(self._categories[name])
+        self._categories[name].append(value)
+        return code
+
+    @staticmethod
+    def _encode_offset(offset):
+        # NegativeInfinity subclasses Infinity, so is checked first.
+        if isinstance(offset, abjad.NegativeInfinity):
+            return -1, 0
+        if isinstance(offset, abjad.Infinity):
+            return 1, 0
+        return offset.numerator, offset.denominator
+
+    def _extend_integers(self, name, values):
+        column = getattr(self, name)
+        if isinstance(column, array.array):
+            try:
+                values = array.array(column.typecode, values)
+            except OverflowError:
+                # Keeps the column as Python integers from here on.
+                column = list(column)
+                setattr(self, name, column)
+        column.extend(values)
+
+    def _extend_rows(self, table, indices):
+        # Copies rows column by column, recoding categories.
+        count = len(self)
+        for name in self._categorical_names:
+            categories = table._categories[name]
+            codes = table._codes[name]
+            column = self._codes[name]
+            new_codes = {}
+            for i in indices:
+                code = codes[i]
+                if code not in new_codes:
+                    new_codes[code] = self._encode(name, categories[code])
+                column.append(new_codes[code])
+        for name in self._integer_names:
+            self._extend_integers(name, self._select(getattr(table, name), indices))
+        for position, i in enumerate(indices):
+            if i in table._extras:
+                self._extras[count + position] = dict(table._extras[i])
+
+    def _get_format_specification(self):
+        return abjad.FormatSpecification(
+            client=self,
+            storage_format_args_values=[list(self)],
+            storage_format_keyword_names=[],
+        )
+
+    def _get_key(self, i):
+        # Matches make_sort_key().
+        voice_name = self._categories["voice_name"][self._codes["voice_name"][i]]
+        if voice_name is None:
+            voice_name = ""
+        return (
+            self._get_offset_key(
+                self._start_numerators[i], self._start_denominators[i]
+            ),
+            self._get_offset_key(self._stop_numerators[i], self._stop_denominators[i]),
+            voice_name,
+        )
+
+    @staticmethod
+    def _get_offset_key(numerator, denominator):
+        if denominator:
+            return quicktions.Fraction(numerator, denominator)
+        return math.copysign(math.inf, numerator)
+
+    def _reorder(self, order, start=0):
+        # Reorders rows from ``start``, where ``order`` lists the rows to
+        # put there.
+        for name in self._integer_names:
+            column = getattr(self, name)
+            column[start:] = self._select(column, order)
+        for column in self._codes.values():
+            column[start:] = self._select(column, order)
+        positions = {i: start + position for position, i in enumerate(order)}
+        self._extras = {
+            positions.get(i, i): extras for i, extras in self._extras.items()
+        }
+
+    @staticmethod
+    def _select(column, indices):
+        values = [column[i] for i in indices]
+        if isinstance(column, array.array):
+            return array.array(column.typecode, values)
+        return values
+
+    ### PUBLIC METHODS ###
+
+    def append(self, timespan):
+        r"""
+        Appends ``timespan`` to table.
+        """
+        if isinstance(timespan, SilentTimespan):
+            silent = True
+        else:
+            assert isinstance(timespan, PerformedTimespan), repr(timespan)
+            silent = False
+        start_offset = timespan.start_offset
+        stop_offset = timespan.stop_offset
+        numerator, denominator = self._encode_offset(start_offset)
+        self._append_integer("_start_numerators", numerator)
+        self._append_integer("_start_denominators", denominator)
+        numerator, denominator = self._encode_offset(stop_offset)
+        self._append_integer("_stop_numerators", numerator)
+        self._append_integer("_stop_denominators", denominator)
+        for name in self._categorical_names:
+            value = (
+                None
+                if silent and name == "music_specifier"
+                else getattr(timespan, name)
+            )
+            self._codes[name].append(self._encode(name, value))
+        self._silent.append(silent)
+        if silent:
+            return
+        extras = {}
+        for name in self._extra_names:
+            value = getattr(timespan, name)
+            if name == "original_start_offset" and value == start_offset:
+                continue
+            if name == "original_stop_offset" and value == stop_offset:
+                continue
+            if value is not None:
+                extras[name] = value
+        if extras:
+            self._extras[len(self) - 1] = extras
+
+    def extend(self, timespans):
+        r"""
+        Extends table with ``timespans``.
+
+        Rows of another table are copied column by column.
+        """
+        if isinstance(timespans, type(self)):
+            self._extend_rows(timespans, range(len(timespans)))
+            return
+        for timespan in timespans:
+            self.append(timespan)
+
+    def merge(self, timespans):
+        r"""
+        Merges sorted ``timespans`` into sorted table.
+
+        ..  container:: example
+
+            >>> table = tsmakers.PerformedTimespanTable(
+            ...     [
+            ...         tsmakers.PerformedTimespan(0, 1, voice_name="A"),
+            ...         tsmakers.PerformedTimespan(1, 2, voice_name="A"),
+            ...         tsmakers.PerformedTimespan(2, 3, voice_name="A"),
+            ...     ]
+            ... )
+            >>> table.merge([tsmakers.PerformedTimespan(1, 2, voice_name="B")])
+            >>> [(str(_.start_offset), _.voice_name) for _ in table]
+            [('0', 'A'), ('1', 'A'), ('1', 'B'), ('2', 'A')]
+
+        Rows sorting before the first of ``timespans`` are left in place,
+        and only the rows after them are reordered. Existing rows sort first
+        among equal keys, like ``sort()`` after ``extend()``.
+        """
+        count = len(self)
+        self.extend(timespans)
+        if not count or count == len(self):
+            return
+        key = self._get_key(count)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if key < self._get_key(middle):
+                high = middle
+            else:
+                low = middle + 1
+        if low == count:
+            return
+        keys = {i: self._get_key(i) for i in range(low, len(self))}
+        order = sorted(range(low, len(self)), key=keys.__getitem__)
+        self._reorder(order, start=low)
+
+    def sort(self):
+        r"""
+        Sorts table rows by start offset, stop offset and voice name, like
+        ``sort_timespans()``.
+        """
+        keys = [self._get_key(i) for i in range(len(self))]
+        self._reorder(sorted(range(len(self)), key=keys.__getitem__))
+
+    def translate(self, translation):
+        r"""
+        Makes table of rows translated by ``translation``.
+
+        ..  container:: example
+
+            >>> table = tsmakers.PerformedTimespanTable(
+            ...     [
+            ...         tsmakers.PerformedTimespan(
+            ...             0, (1, 2), original_stop_offset=1, voice_name="A"
+            ...         ),
+            ...         tsmakers.SilentTimespan(stop_offset=1, voice_name="B"),
+            ...     ]
+            ... )
+            >>> for timespan in table.translate((1, 4)):
+            ...     timespan
+            ...
+            tsmakers.PerformedTimespan(
+                start_offset=abjad.Offset((1, 4)),
+                stop_offset=abjad.Offset((3, 4)),
+                original_stop_offset=abjad.Offset((5, 4)),
+                voice_name='A',
+                )
+            tsmakers.SilentTimespan(
+                start_offset=NegativeInfinity,
+                stop_offset=abjad.Offset((5, 4)),
+                voice_name='B',
+                )
+
+        Returns new table.
+        """
+        translation = abjad.Duration(translation)
+        fraction = quicktions.Fraction(translation.numerator, translation.denominator)
+        table = self[:]
+        for prefix in ("_start", "_stop"):
+            numerators = getattr(table, prefix + "_numerators")
+            denominators = getattr(table, prefix + "_denominators")
+            new_numerators, new_denominators = [], []
+            for numerator, denominator in zip(numerators, denominators):
+                if denominator:
+                    offset = quicktions.Fraction(numerator, denominator) + fraction
+                    numerator, denominator = offset.numerator, offset.denominator
+                new_numerators.append(numerator)
+                new_denominators.append(denominator)
+            for name, values in (
+                (prefix + "_numerators", new_numerators),
+                (prefix + "_denominators", new_denominators),
+            ):
+                del getattr(table, name)[:]
+                table._extend_integers(name, values)
+        for extras in table._extras.values():
+            for name in ("original_start_offset", "original_stop_offset"):
+                if name in extras:
+                    extras[name] = extras[name] + translation
+        return table
+
+    def to_timespan_list(self):
+        r"""
+        Changes table to timespan list.
+        """
+        return abjad.TimespanList(list(self))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def start_offset(self):
+        r"""
+        Gets earliest start offset in table.
+        """
+        numerators = self._start_numerators
+        denominators = self._start_denominators
+        i = min(
+            range(len(self)),
+            key=lambda i: self._get_offset_key(numerators[i], denominators[i]),
+        )
+        return self._decode_offset(numerators[i], denominators[i])
+
+    @property
+    def stop_offset(self):
+        r"""
+        Gets latest stop offset in table.
+        """
+        numerators = self._stop_numerators
+        denominators = self._stop_denominators
+        i = max(
+            range(len(self)),
+            key=lambda i: self._get_offset_key(numerators[i], denominators[i]),
+        )
+        return self._decode_offset(numerators[i], denominators[i])
+
+    @property
+    def timespan(self):
+        r"""
+        Gets timespan of table.
+        """
+        return abjad.Timespan(self.start_offset, self.stop_offset)
+
+    @property
+    def voice_names(self):
+        r"""
+        Gets voice names in table, in order of first appearance.
+        """
+        return tuple(self._categories["voice_name"])
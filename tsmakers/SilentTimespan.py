@@ -1,5 +1,7 @@
 import abjad
 
+from .sorting import make_sort_key
+
 
 class SilentTimespan(abjad.Timespan):
     r"""
@@ -10,6 +12,7 @@ class SilentTimespan(abjad.Timespan):
 
     __slots__ = (
         "_layer",
+        "_sort_key",
         "_voice_name",
         "_handler",
     )
@@ -32,6 +35,7 @@ class SilentTimespan(abjad.Timespan):
         if layer is not None:
             layer = int(layer)
         self._layer = layer
+        self._sort_key = None
         self._voice_name = voice_name
         self._handler = handler
 
@@ -99,6 +103,17 @@ class SilentTimespan(abjad.Timespan):
     def minimum_duration(self):
         return 0
 
+    @property
+    def sort_key(self):
+        r"""
+        Gets sort key of start offset, stop offset and voice name.
+        """
+        if self._sort_key is None:
+            self._sort_key = make_sort_key(
+                self._start_offset, self._stop_offset, self._voice_name
+            )
+        return self._sort_key
+
     @property
     def voice_name(self):
         return self._voice_name
@@ -1,12 +1,24 @@
 import collections
+import copy
 
 import abjad
 from abjadext import rmakers
 
+from .construction import set_offsets
 from .Cursor import Cursor
+from .MusicSpecifierSequence import MusicSpecifierSequence
+from .PerformedTimespan import PerformedTimespan
+from .PerformedTimespanTable import PerformedTimespanTable
 from .SilentTimespan import SilentTimespan
+from .sorting import sort_timespans
+from .TaleaTimespanMakerState import TaleaTimespanMakerState
 from .TimespanMaker import TimespanMaker
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TaleaTimespanMaker(TimespanMaker):
     r"""
@@ -580,6 +592,47 @@ class TaleaTimespanMaker(TimespanMaker):
                     ]
                 )
 
+    ..  container:: example
+
+        When repeating, output turns periodic once the talea positions and the
+        music specifier seed recur. One period is made step by step and then
+        translated across long targets:
+
+        >>> timespan_maker = tsmakers.TaleaTimespanMaker(
+        ...     playing_talea=rmakers.Talea(counts=(2, 3), denominator=8),
+        ...     silence_talea=rmakers.Talea(counts=(1,), denominator=8),
+        ... )
+        >>> timespans = timespan_maker(
+        ...     music_specifiers={"Violin": None},
+        ...     target_timespan=abjad.Timespan(0, 1000),
+        ... )
+        >>> len(timespans)
+        2286
+
+        >>> for timespan in timespans[-3:]:
+        ...     timespan.start_offset, timespan.stop_offset
+        ...
+        (Offset((3995, 4)), Offset((7993, 8)))
+        (Offset((3997, 4)), Offset((1999, 2)))
+        (Offset((7997, 8)), Offset((1000, 1)))
+
+    ..  container:: example
+
+        In tick mode, offsets are counted in integer ticks of one common
+        denominator while timespans are made. The timespans are the same:
+
+        >>> timespans = timespan_maker(
+        ...     music_specifiers={"Violin": None, "Viola": None},
+        ...     target_timespan=abjad.Timespan((1, 3), 12),
+        ... )
+        >>> tick_timespan_maker = abjad.new(timespan_maker, tick_mode=True)
+        >>> tick_timespans = tick_timespan_maker(
+        ...     music_specifiers={"Violin": None, "Viola": None},
+        ...     target_timespan=abjad.Timespan((1, 3), 12),
+        ... )
+        >>> format(tick_timespans) == format(timespans)
+        True
+
     """
 
     ### CLASS VARIABLES ###
@@ -620,6 +673,7 @@ class TaleaTimespanMaker(TimespanMaker):
         step_anchor=abjad.Right,
         synchronize_groupings=False,
         synchronize_step=False,
+        tick_mode=None,
         timespan_specifier=None,
     ):
         TimespanMaker.__init__(
@@ -627,6 +681,7 @@ class TaleaTimespanMaker(TimespanMaker):
             division_masks=division_masks,
             padding=padding,
             seed=seed,
+            tick_mode=tick_mode,
             timespan_specifier=timespan_specifier,
         )
 
@@ -675,44 +730,88 @@ class TaleaTimespanMaker(TimespanMaker):
         self,
         layer=None,
         music_specifiers=None,
+        resume_point=None,
         target_timespan=None,
         timespan_list=None,
     ):
+        index = None
+        if self.seed is not None and 0 < self.seed:
+            index = self.seed
+        indices = (index,) * 4
+        if resume_point:
+            indices = resume_point["cursor_indices"]
         initial_silence_talea = self.initial_silence_talea
         if not initial_silence_talea:
             initial_silence_talea = rmakers.Talea(counts=(0,), denominator=1)
-        initial_silence_talea = Cursor(initial_silence_talea)
-        playing_talea = Cursor(self.playing_talea)
-        playing_groupings = Cursor(self.playing_groupings)
+        initial_silence_talea = Cursor(initial_silence_talea, index=indices[0])
+        playing_talea = Cursor(self.playing_talea, index=indices[1])
+        playing_groupings = Cursor(self.playing_groupings, index=indices[2])
         silence_talea = self.silence_talea
         if silence_talea is None:
             silence_talea = rmakers.Talea(counts=(0,), denominator=1)
-        silence_talea = Cursor(silence_talea)
-
-        if self.seed is not None and 0 < self.seed:
-            for _ in range(self.seed):
-                next(initial_silence_talea)
-                next(playing_talea)
-                next(playing_groupings)
-                next(silence_talea)
+        silence_talea = Cursor(silence_talea, index=indices[3])
 
+        start_offset = target_timespan.start_offset
+        stop_offset = target_timespan.stop_offset
+        denominator = None
+        if self.tick_mode:
+            cursors = (initial_silence_talea, playing_talea, silence_talea)
+            values = [start_offset, stop_offset]
+            if self.padding:
+                values.append(self.padding)
+            if resume_point:
+                values.append(resume_point["start_offset"])
+                if resume_point.get("latest_stop_offset") is not None:
+                    values.append(resume_point["latest_stop_offset"])
+            for cursor in cursors:
+                values.extend(cursor.sequence)
+            denominator = self._get_tick_denominator(values)
+            initial_silence_talea, playing_talea, silence_talea = (
+                self._to_tick_cursor(_, denominator) for _ in cursors
+            )
+            start_offset = self._to_ticks(start_offset, denominator)
+            stop_offset = self._to_ticks(stop_offset, denominator)
+            if resume_point:
+                for key in ("latest_stop_offset", "start_offset"):
+                    if resume_point.get(key) is not None:
+                        resume_point[key] = self._to_ticks(
+                            resume_point[key], denominator
+                        )
+
+        # Steps are written straight into a table when making into one.
+        if isinstance(timespan_list, PerformedTimespanTable) and not self.reflect:
+            new_timespan_list = PerformedTimespanTable()
+        else:
+            new_timespan_list = abjad.TimespanList()
         if self.synchronize_step:
             procedure = self._make_with_synchronized_step
         else:
             procedure = self._make_without_synchronized_step
         new_timespan_list, final_offset = procedure(
+            denominator=denominator,
             initial_silence_talea=initial_silence_talea,
             layer=layer,
             playing_talea=playing_talea,
             playing_groupings=playing_groupings,
             music_specifiers=music_specifiers,
+            resume_point=resume_point,
             silence_talea=silence_talea,
-            target_timespan=target_timespan,
-        )
-        assert all(0 < _.duration for _ in new_timespan_list), (
-            format(self),
-            target_timespan,
+            start_offset=start_offset,
+            stop_offset=stop_offset,
+            timespan_list=new_timespan_list,
         )
+        if resume_point is not None and denominator is not None:
+            for key in ("latest_stop_offset", "start_offset"):
+                if resume_point.get(key) is not None:
+                    resume_point[key] = abjad.Offset(resume_point[key], denominator)
+        if isinstance(new_timespan_list, PerformedTimespanTable):
+            keys = map(new_timespan_list._get_key, range(len(new_timespan_list)))
+            assert all(_[0] < _[1] for _ in keys), (format(self), target_timespan)
+        else:
+            assert all(0 < _.duration for _ in new_timespan_list), (
+                format(self),
+                target_timespan,
+            )
 
         if self.reflect:
             new_timespan_list = new_timespan_list.reflect(
@@ -721,28 +820,180 @@ class TaleaTimespanMaker(TimespanMaker):
 
         return new_timespan_list
 
+    @staticmethod
+    def _finish_resume_point(resume_point, timespan_list):
+        if resume_point is None:
+            return
+        timespan_count = resume_point.pop("timespan_count")
+        resume_point["timespans"] = tuple(timespan_list[timespan_count:])
+
+    @staticmethod
+    def _get_step_state(cursors, indices, music_specifier, seed):
+        state = tuple(
+            index % len(cursor.sequence) for index, cursor in zip(indices, cursors)
+        )
+        return state + (seed % len(music_specifier),)
+
+    def _make_planned_steps(
+        self,
+        context_name=None,
+        counter=None,
+        cursors=None,
+        denominator=None,
+        layer=None,
+        music_specifier=None,
+        start_offset=None,
+        states=None,
+        steps=None,
+        stop_offset=None,
+        timespan_list=None,
+    ):
+        r"""
+        Makes the steps of one context which ``_plan_steps()`` finds can be
+        made in full, and advances ``cursors`` past them.
+
+        Stops early, before the step whose cursor state is in ``states``, so
+        the step-by-step loop can tile from there. Records made steps in
+        ``states`` and ``steps`` like that loop does.
+
+        Returns offset where the next step starts.
+        """
+        playing_talea, playing_groupings, silence_talea = cursors
+        values = [start_offset, stop_offset]
+        for cursor in cursors:
+            if cursor is not playing_groupings:
+                values.extend(cursor.sequence)
+        scale = self._get_tick_denominator(values)
+        playing_counts = [self._to_ticks(_, scale) for _ in playing_talea.sequence]
+        starts, positions, reaches = self._plan_steps(
+            playing_counts=playing_counts,
+            playing_groupings=list(playing_groupings.sequence),
+            playing_index=playing_talea.index or 0,
+            grouping_index=playing_groupings.index or 0,
+            silence_counts=[self._to_ticks(_, scale) for _ in silence_talea.sequence],
+            silence_index=silence_talea.index or 0,
+            start_offset=self._to_ticks(start_offset, scale),
+            step_anchor=self.step_anchor,
+            stop_offset=self._to_ticks(stop_offset, scale),
+        )
+
+        def convert(ticks):
+            if denominator is None:
+                # The step-by-step loop counts rational offsets.
+                return abjad.Offset(ticks, scale)
+            return ticks
+
+        step_count = len(starts) - 1
+        for i in range(step_count):
+            seed = counter[context_name]
+            indices = (
+                positions[i],
+                (playing_groupings.index or 0) + i,
+                (silence_talea.index or 0) + i,
+            )
+            if states is not None:
+                state = self._get_step_state(cursors, indices, music_specifier, seed)
+                if state in states:
+                    step_count = i
+                    break
+                states[state] = len(steps)
+                steps.append(
+                    (
+                        convert(starts[i]),
+                        indices,
+                        len(timespan_list),
+                        convert(reaches[i]),
+                    )
+                )
+            durations = [
+                playing_counts[_ % len(playing_counts)]
+                for _ in range(positions[i], positions[i + 1])
+            ]
+            if self.fuse_groups:
+                durations = [sum(durations)]
+            new_timespans = music_specifier(
+                durations=durations,
+                layer=layer,
+                denominator=scale * (denominator or 1),
+                division_masks=self.division_masks,
+                padding=self.padding,
+                seed=seed,
+                start_offset=starts[i],
+                timespan_specifier=self.timespan_specifier,
+                voice_name=context_name,
+            )
+            if all(isinstance(_, SilentTimespan) for _ in new_timespans):
+                new_timespans = []
+            timespan_list.extend(new_timespans)
+            counter[context_name] += 1
+        playing_talea.advance(positions[step_count] - positions[0])
+        playing_groupings.advance(step_count)
+        silence_talea.advance(step_count)
+        return convert(starts[step_count])
+
+    @staticmethod
+    def _mark_resume_point(resume_point, cursors=None, timespan_list=None, **values):
+        # Records where the current step starts. Only a run's last step can
+        # be cut short by the target timespan, so a longer run made from the
+        # last recorded step matches a run made from the start.
+        if resume_point is None:
+            return
+        resume_point.update(values)
+        resume_point["cursor_indices"] = tuple(_.index for _ in cursors)
+        resume_point["timespan_count"] = len(timespan_list)
+
     def _make_with_synchronized_step(
         self,
+        denominator=None,
         initial_silence_talea=None,
         layer=None,
         playing_talea=None,
         playing_groupings=None,
         music_specifiers=None,
+        resume_point=None,
         silence_talea=None,
-        target_timespan=None,
+        start_offset=None,
+        stop_offset=None,
+        timespan_list=None,
     ):
         counter = collections.Counter()
-        timespan_list = abjad.TimespanList()
-        start_offset = target_timespan.start_offset
-        stop_offset = target_timespan.stop_offset
         can_continue = True
         division_mask_seed = 0
+        # Steps append to the list unsorted, tracking the latest stop offset,
+        # and the list is sorted once when done.
+        latest_stop_offset = None
+        cursors = (initial_silence_talea, playing_talea, playing_groupings)
+        cursors += (silence_talea,)
+        if resume_point:
+            counter.update(resume_point["counter"])
+            division_mask_seed = resume_point["division_mask_seed"]
+            latest_stop_offset = resume_point["latest_stop_offset"]
+            start_offset = resume_point["start_offset"]
+        self._mark_resume_point(
+            resume_point,
+            counter=dict(counter),
+            cursors=cursors,
+            division_mask_seed=division_mask_seed,
+            latest_stop_offset=latest_stop_offset,
+            start_offset=start_offset,
+            timespan_list=timespan_list,
+        )
         while start_offset < stop_offset and can_continue:
+            self._mark_resume_point(
+                resume_point,
+                counter=dict(counter),
+                cursors=cursors,
+                division_mask_seed=division_mask_seed,
+                latest_stop_offset=latest_stop_offset,
+                start_offset=start_offset,
+                timespan_list=timespan_list,
+            )
             silence_duration = next(silence_talea)
-            durations = []
+            durations, durations_sum = [], 0
             if self.synchronize_groupings:
                 grouping = next(playing_groupings)
-                durations = [next(playing_talea) for _ in range(grouping)]
+                durations = playing_talea.take(grouping)
+                durations_sum = sum(durations)
             for context_name, music_specifier in music_specifiers.items():
                 if context_name not in counter:
                     counter[context_name] = 0
@@ -750,10 +1001,11 @@ class TaleaTimespanMaker(TimespanMaker):
                 initial_silence_duration = next(initial_silence_talea)
                 if not self.synchronize_groupings:
                     grouping = next(playing_groupings)
-                    durations = [next(playing_talea) for _ in range(grouping)]
+                    durations = playing_talea.take(grouping)
+                    durations_sum = sum(durations)
                 maximum_offset = (
                     start_offset
-                    + sum(durations)
+                    + durations_sum
                     + silence_duration
                     + initial_silence_duration
                 )
@@ -783,6 +1035,7 @@ class TaleaTimespanMaker(TimespanMaker):
                 new_timespans = music_specifier(
                     durations=valid_durations,
                     layer=layer,
+                    denominator=denominator,
                     division_masks=self.division_masks,
                     padding=self.padding,
                     seed=seed,
@@ -796,50 +1049,134 @@ class TaleaTimespanMaker(TimespanMaker):
                 if all(isinstance(_, SilentTimespan) for _ in new_timespans):
                     new_timespans[:] = []
                 timespan_list.extend(new_timespans)
+                for timespan in new_timespans:
+                    timespan_stop_offset = timespan.stop_offset
+                    if denominator is not None:
+                        timespan_stop_offset = self._to_ticks(
+                            timespan_stop_offset, denominator
+                        )
+                    if (
+                        latest_stop_offset is None
+                        or latest_stop_offset < timespan_stop_offset
+                    ):
+                        latest_stop_offset = timespan_stop_offset
                 counter[context_name] += 1
-            timespan_list.sort()
-            if self.step_anchor == abjad.Right and timespan_list:
-                start_offset = timespan_list.stop_offset
+            if self.step_anchor == abjad.Right and latest_stop_offset is not None:
+                start_offset = latest_stop_offset
             start_offset += silence_duration
             if not self.repeat:
                 break
+        self._finish_resume_point(resume_point, timespan_list)
+        sort_timespans(timespan_list)
         return timespan_list, start_offset
 
     def _make_without_synchronized_step(
         self,
+        denominator=None,
         initial_silence_talea=None,
         layer=None,
         playing_talea=None,
         playing_groupings=None,
         music_specifiers=None,
+        resume_point=None,
         silence_talea=None,
-        target_timespan=None,
+        start_offset=None,
+        stop_offset=None,
+        timespan_list=None,
     ):
         counter = collections.Counter()
-        timespan_list = abjad.TimespanList()
-        start_offset = target_timespan.start_offset
-        stop_offset = target_timespan.stop_offset
+        target_start_offset = start_offset
         final_offset = abjad.Offset(0)
+        cursors = (playing_talea, playing_groupings, silence_talea)
         for context_name, music_specifier in music_specifiers.items():
 
             if context_name not in counter:
                 counter[context_name] = 0
 
-            start_offset = target_timespan.start_offset
-            start_offset += next(initial_silence_talea)
+            if resume_point:
+                # Only runs of one context resume, see make_resumable().
+                counter[context_name] = resume_point["counter"][context_name]
+                start_offset = resume_point["start_offset"]
+            else:
+                start_offset = target_start_offset
+                start_offset += next(initial_silence_talea)
             can_continue = True
 
+            # When repeating, each step is fixed up to translation by the
+            # cursor positions and the seed. Steps are recorded until that
+            # state recurs, and the steps since its first occurrence are then
+            # tiled as one period.
+            states, steps = None, []
+            if self.repeat and isinstance(music_specifier, MusicSpecifierSequence):
+                states = {}
+
+            if self.repeat and numpy is not None:
+                start_offset = self._make_planned_steps(
+                    context_name=context_name,
+                    counter=counter,
+                    cursors=cursors,
+                    denominator=denominator,
+                    layer=layer,
+                    music_specifier=music_specifier,
+                    start_offset=start_offset,
+                    states=states,
+                    steps=steps,
+                    stop_offset=stop_offset,
+                    timespan_list=timespan_list,
+                )
+
+            self._mark_resume_point(
+                resume_point,
+                counter=dict(counter),
+                cursors=(initial_silence_talea,) + cursors,
+                start_offset=start_offset,
+                timespan_list=timespan_list,
+            )
             while start_offset < stop_offset and can_continue:
 
                 seed = counter[context_name]
 
+                if states is not None:
+                    indices = tuple(_.index or 0 for _ in cursors)
+                    state = self._get_step_state(
+                        cursors, indices, music_specifier, seed
+                    )
+                    if state in states:
+                        first_step = states[state]
+                        translation = start_offset - steps[first_step][0]
+                        count = self._tile_steps(
+                            cursors=cursors,
+                            denominator=denominator,
+                            start_offset=start_offset,
+                            steps=steps[first_step:],
+                            stop_offset=stop_offset,
+                            timespan_list=timespan_list,
+                        )
+                        counter[context_name] += count * (len(steps) - first_step)
+                        start_offset += count * translation
+                        states = None
+                        continue
+                    states[state] = len(steps)
+
+                self._mark_resume_point(
+                    resume_point,
+                    counter=dict(counter),
+                    cursors=(initial_silence_talea,) + cursors,
+                    start_offset=start_offset,
+                    timespan_list=timespan_list,
+                )
                 silence_duration = next(silence_talea)
                 grouping = next(playing_groupings)
-                durations = [next(playing_talea) for _ in range(grouping)]
+                durations = playing_talea.take(grouping)
+                durations_sum = sum(durations)
                 # if self.padding:
                 #    start_offset += self.padding
 
-                maximum_offset = start_offset + sum(durations) + silence_duration
+                maximum_offset = start_offset + durations_sum + silence_duration
+                if states is not None:
+                    steps.append(
+                        (start_offset, indices, len(timespan_list), maximum_offset)
+                    )
                 maximum_offset = min(maximum_offset, stop_offset)
                 if self.step_anchor is abjad.Left:
                     maximum_offset = min(
@@ -866,6 +1203,7 @@ class TaleaTimespanMaker(TimespanMaker):
                 new_timespans = music_specifier(
                     durations=valid_durations,
                     layer=layer,
+                    denominator=denominator,
                     division_masks=self.division_masks,
                     padding=self.padding,
                     seed=seed,
@@ -897,8 +1235,385 @@ class TaleaTimespanMaker(TimespanMaker):
                 counter[context_name] += 1
             if final_offset < start_offset:
                 final_offset = start_offset
+        self._finish_resume_point(resume_point, timespan_list)
         return timespan_list, final_offset
 
+    @staticmethod
+    def _plan_steps(
+        playing_counts=None,
+        playing_groupings=None,
+        playing_index=None,
+        grouping_index=None,
+        silence_counts=None,
+        silence_index=None,
+        start_offset=None,
+        step_anchor=None,
+        stop_offset=None,
+    ):
+        r"""
+        Plans unsynchronized steps with NumPy.
+
+        Counts, offsets and cursor indices are integers, with counts and
+        offsets in ticks. Steps are planned from the cursor indices until the
+        first step which would not place all its durations, or after which
+        the next step would not start before ``stop_offset``. That step is
+        where the step-by-step loop backtracks its cursors, so it is left to
+        the loop.
+
+        Returns start offsets, playing talea indices and reaches of planned
+        steps. Start offsets and playing talea indices have one more item,
+        for the step after the last planned step.
+        """
+        limit = 2**62
+        playing_sums = numpy.cumsum([0] + list(playing_counts), dtype=object)
+        playing_count = len(playing_counts)
+        playing_groupings = numpy.array(playing_groupings, dtype=numpy.int64)
+        silence_counts = numpy.array(silence_counts, dtype=object)
+        maximum_advance = max(playing_groupings) * max(playing_counts)
+        maximum_advance += max(silence_counts)
+        starts, positions, reaches = [start_offset], [playing_index], []
+        step_count = 64
+        while True:
+            # Offsets and playing talea prefix sums stay below ``bound``.
+            bound = max(abs(start_offset), abs(stop_offset))
+            bound += (step_count + 1) * maximum_advance
+            bound += abs(playing_index) * max(playing_counts)
+            dtype = numpy.int64 if bound < limit else object
+            steps = numpy.arange(step_count)
+            groupings = playing_groupings[
+                (grouping_index + steps) % len(playing_groupings)
+            ].astype(dtype)
+            silences = silence_counts[
+                (silence_index + steps) % len(silence_counts)
+            ].astype(dtype)
+            indices = numpy.cumsum(
+                numpy.concatenate(([playing_index], groupings)), dtype=dtype
+            )
+            # Playing durations are summed from prefix sums over one period.
+            quotients, remainders = divmod(indices, playing_count)
+            sums = quotients * playing_sums[-1]
+            sums = sums + playing_sums[remainders.astype(numpy.int64)]
+            sums = numpy.diff(sums).astype(dtype)
+            if step_anchor is abjad.Left:
+                advances = silences
+            else:
+                advances = sums + silences
+            step_stops = start_offset + numpy.cumsum(advances, dtype=dtype)
+            step_starts = step_stops - advances
+            is_full = (step_stops < stop_offset).astype(bool)
+            if step_anchor is abjad.Left:
+                is_full &= (sums <= silences).astype(bool)
+            partial_steps = numpy.flatnonzero(~is_full)
+            count = partial_steps[0] if len(partial_steps) else step_count
+            starts.extend(step_stops[:count].tolist())
+            positions.extend(indices[1 : count + 1].tolist())
+            reaches.extend((step_starts + sums + silences)[:count].tolist())
+            if count < step_count:
+                break
+            start_offset = starts[-1]
+            playing_index = positions[-1]
+            grouping_index += step_count
+            silence_index += step_count
+            step_count *= 2
+        return starts, positions, reaches
+
+    def _tile_steps(
+        self,
+        cursors=None,
+        denominator=None,
+        start_offset=None,
+        steps=None,
+        stop_offset=None,
+        timespan_list=None,
+    ):
+        r"""
+        Repeats ``steps``, one period of steps, from ``start_offset`` for as
+        many whole periods as end before ``stop_offset``.
+
+        A period is repeated only when every step in it stops short of
+        ``stop_offset``, so no step is cut short by the target timespan.
+        Copies translate the period's timespans, and cursors advance by the
+        items the copied steps would have drawn.
+
+        Returns number of periods repeated.
+        """
+        period_start_offset, indices, first_index, _ = steps[0]
+        translation = start_offset - period_start_offset
+        reach = max(_[3] for _ in steps) - period_start_offset
+        if translation <= 0 or stop_offset <= start_offset + reach:
+            return 0
+        count = -((start_offset + reach - stop_offset) // translation)
+        timespans = timespan_list[first_index:]
+        if denominator is not None:
+            translation = abjad.Duration(translation, denominator)
+        for i in range(1, count + 1):
+            if isinstance(timespans, PerformedTimespanTable):
+                timespan_list.extend(timespans.translate(i * translation))
+                continue
+            timespan_list.extend(
+                self._translate_timespan(_, i * translation) for _ in timespans
+            )
+        for cursor, index in zip(cursors, indices):
+            cursor.advance(count * ((cursor.index or 0) - index))
+        return count
+
+    @staticmethod
+    def _translate_timespan(timespan, translation):
+        # Copies slot by slot, which is much faster than abjad.new().
+        timespan_ = copy.copy(timespan)
+        set_offsets(
+            timespan_,
+            timespan.start_offset + translation,
+            timespan.stop_offset + translation,
+        )
+        timespan_._sort_key = None
+        if isinstance(timespan, PerformedTimespan):
+            timespan_._original_start_offset = (
+                timespan.original_start_offset + translation
+            )
+            timespan_._original_stop_offset = (
+                timespan.original_stop_offset + translation
+            )
+        return timespan_
+
+    ### PUBLIC METHODS ###
+
+    def make_resumable(
+        self,
+        layer=None,
+        music_specifiers=None,
+        silenced_context_names=None,
+        state=None,
+        target_timespan=None,
+        timespan_list=None,
+        timespan_list_is_sorted=False,
+    ):
+        r"""
+        Makes timespans like calling the timespan maker, and a state to
+        resume from.
+
+        Given the state of an earlier run, makes only the timespans after
+        that run's last step, over a target timespan which starts where the
+        earlier one did and stops no earlier. The last step's timespans are
+        made again, as they may have been cut short, and replace the ones in
+        ``timespan_list``. Layer, music specifiers, silenced context names
+        and target timespan default to the state's.
+
+        ..  container:: example
+
+            >>> timespan_maker = tsmakers.TaleaTimespanMaker(
+            ...     playing_talea=abjadext.rmakers.Talea(
+            ...         counts=[3, 2, 4],
+            ...         denominator=8,
+            ...     ),
+            ...     playing_groupings=[1, 2],
+            ...     silence_talea=abjadext.rmakers.Talea(
+            ...         counts=[1, 3],
+            ...         denominator=8,
+            ...     ),
+            ... )
+            >>> timespans, state = timespan_maker.make_resumable(
+            ...     music_specifiers={"Violin": None},
+            ...     target_timespan=abjad.Timespan(0, 4),
+            ... )
+            >>> len(timespans), state.resume_offset
+            (8, Offset((15, 4)))
+
+            >>> timespans, state = timespan_maker.make_resumable(
+            ...     state=state,
+            ...     target_timespan=abjad.Timespan(0, 16),
+            ...     timespan_list=timespans,
+            ...     timespan_list_is_sorted=True,
+            ... )
+            >>> len(timespans), state.resume_offset
+            (30, Offset((121, 8)))
+
+            >>> format(timespans) == format(
+            ...     timespan_maker(
+            ...         music_specifiers={"Violin": None},
+            ...         target_timespan=abjad.Timespan(0, 16),
+            ...     )
+            ... )
+            True
+
+        ..  container:: example
+
+            Silences span the whole run, so silenced contexts get their
+            silences made again:
+
+            >>> timespans, state = timespan_maker.make_resumable(
+            ...     music_specifiers={"Violin": None},
+            ...     silenced_context_names=["Cello"],
+            ...     target_timespan=abjad.Timespan(0, 4),
+            ... )
+            >>> timespans, state = timespan_maker.make_resumable(
+            ...     state=state,
+            ...     target_timespan=abjad.Timespan(0, 8),
+            ...     timespan_list=timespans,
+            ... )
+            >>> format(timespans) == format(
+            ...     timespan_maker(
+            ...         music_specifiers={"Violin": None},
+            ...         silenced_context_names=["Cello"],
+            ...         target_timespan=abjad.Timespan(0, 8),
+            ...     )
+            ... )
+            True
+
+            >>> len(state.silent_timespans)
+            10
+
+        ..  container:: example
+
+            Unsynchronized steps of one context continue where the last
+            context stopped, so runs of more than one context do not resume:
+
+            >>> timespans, state = timespan_maker.make_resumable(
+            ...     music_specifiers={"Violin": None, "Cello": None},
+            ...     target_timespan=abjad.Timespan(0, 4),
+            ... )
+            Traceback (most recent call last):
+                ...
+            ValueError: unsynchronized runs resume with one context only.
+
+        Raises ``ValueError`` when a resumed run could differ from a run made
+        from the start.
+
+        Returns timespan list and state.
+        """
+        if self.reflect:
+            raise ValueError("reflected runs do not resume.")
+        if timespan_list is None:
+            timespan_list = abjad.TimespanList()
+        # Timespans of the last step are found by identity, so the list must
+        # hold the timespans it is given.
+        assert isinstance(timespan_list, abjad.TimespanList), repr(timespan_list)
+        resume_point = {}
+        if state is None:
+            if target_timespan is None:
+                raise ValueError("target timespan is required without a state.")
+        else:
+            assert isinstance(state, TaleaTimespanMakerState), repr(state)
+            timespan_maker = state.timespan_maker
+            if timespan_maker is not self and format(timespan_maker) != format(self):
+                raise ValueError("state was made by another timespan maker.")
+            if target_timespan is None:
+                target_timespan = abjad.Timespan(state.start_offset, state.stop_offset)
+            if target_timespan.start_offset != state.start_offset:
+                message = f"target timespan must start at {state.start_offset!s}."
+                raise ValueError(message)
+            if target_timespan.stop_offset < state.stop_offset:
+                message = f"target timespan must not stop before {state.stop_offset!s}."
+                raise ValueError(message)
+            if layer is None:
+                layer = state.layer
+            if music_specifiers is None:
+                music_specifiers = state.music_specifiers
+            if silenced_context_names is None:
+                silenced_context_names = state.silenced_context_names
+            if layer != state.layer:
+                raise ValueError(f"layer must be {state.layer!r}.")
+            if list(music_specifiers) != list(state.music_specifiers):
+                message = f"contexts must be {list(state.music_specifiers)!r}."
+                raise ValueError(message)
+            music_specifiers = self._coerce_music_specifiers(music_specifiers)
+            for context_name, music_specifier in music_specifiers.items():
+                music_specifier_ = state.music_specifiers[context_name]
+                if music_specifier is music_specifier_:
+                    continue
+                if format(music_specifier) != format(music_specifier_):
+                    message = (
+                        f"music specifier of {context_name!r} must be the state's."
+                    )
+                    raise ValueError(message)
+            if silenced_context_names is not None:
+                silenced_context_names = tuple(silenced_context_names)
+            if silenced_context_names != state.silenced_context_names:
+                message = "silenced context names must be {!r}."
+                message = message.format(state.silenced_context_names)
+                raise ValueError(message)
+            resume_point.update(
+                counter=state.counter,
+                cursor_indices=state.cursor_indices,
+                division_mask_seed=state.division_mask_seed,
+                latest_stop_offset=state.latest_stop_offset,
+                start_offset=state.resume_offset,
+            )
+        music_specifiers = self._coerce_music_specifiers(music_specifiers)
+        if not self.synchronize_step and 1 < len(music_specifiers):
+            message = "unsynchronized runs resume with one context only."
+            raise ValueError(message)
+        made_timespans = []
+        if state is not None:
+            # Timespans may be held twice, so occurrences are counted.
+            counts = collections.Counter(id(_) for _ in state.timespans)
+            made_counts = counts.copy()
+            for timespan in state.made_timespans:
+                if made_counts[id(timespan)]:
+                    made_counts[id(timespan)] -= 1
+                else:
+                    made_timespans.append(timespan)
+            counts.update(id(_) for _ in state.silent_timespans)
+            count = sum(counts.values())
+            indices = []
+            for i in reversed(range(len(timespan_list))):
+                if len(indices) == count:
+                    break
+                if counts[id(timespan_list[i])]:
+                    counts[id(timespan_list[i])] -= 1
+                    indices.append(i)
+            if len(indices) != count:
+                raise ValueError("timespan list lacks timespans of state.")
+            for i in indices:
+                del timespan_list[i]
+        new_timespans = self._make_timespans(
+            layer=layer,
+            music_specifiers=music_specifiers,
+            resume_point=resume_point,
+            target_timespan=target_timespan,
+            timespan_list=timespan_list,
+        )
+        silent_timespans = []
+        if silenced_context_names:
+            # Silences span the whole run, so are made again over all of it.
+            made_timespans.extend(new_timespans)
+            if self.synchronize_step:
+                sort_timespans(made_timespans)
+            count = len(made_timespans)
+            self._cleanup_silent_timespans(
+                layer=layer,
+                silenced_context_names=silenced_context_names,
+                timespans=made_timespans,
+            )
+            silent_timespans = made_timespans[count:]
+            del made_timespans[count:]
+            new_timespans.extend(silent_timespans)
+        else:
+            made_timespans = []
+        state = TaleaTimespanMakerState(
+            counter=resume_point["counter"],
+            cursor_indices=resume_point["cursor_indices"],
+            division_mask_seed=resume_point.get("division_mask_seed", 0),
+            latest_stop_offset=resume_point.get("latest_stop_offset"),
+            layer=layer,
+            made_timespans=made_timespans,
+            music_specifiers=music_specifiers,
+            resume_offset=resume_point["start_offset"],
+            silenced_context_names=silenced_context_names,
+            silent_timespans=silent_timespans,
+            start_offset=target_timespan.start_offset,
+            stop_offset=target_timespan.stop_offset,
+            timespan_maker=self,
+            timespans=resume_point["timespans"],
+        )
+        if timespan_list_is_sorted:
+            sort_timespans(new_timespans)
+            self._merge_timespans(timespan_list, new_timespans)
+        else:
+            timespan_list.extend(new_timespans)
+            sort_timespans(timespan_list)
+        return timespan_list, state
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -0,0 +1,188 @@
+import abjad
+
+
+class TaleaTimespanMakerState(object):
+    r"""
+    A talea timespan maker state.
+
+    Made by ``TaleaTimespanMaker.make_resumable()``, and accepted back by it
+    to resume a run over a longer target timespan.
+
+    Records where the run's last step started: its offset, the index of each
+    talea cursor, the music specifier seed of each context, the division
+    mask seed and, with synchronized steps, the latest stop offset made so
+    far. The last step may have been cut short by the target timespan, so
+    its timespans are recorded too, and a resumed run replaces them.
+
+    When contexts are silenced, silences span the whole run, so the
+    timespans made so far and the silences made over them are recorded,
+    and a resumed run makes its silences again.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_counter",
+        "_cursor_indices",
+        "_division_mask_seed",
+        "_latest_stop_offset",
+        "_layer",
+        "_made_timespans",
+        "_music_specifiers",
+        "_resume_offset",
+        "_silenced_context_names",
+        "_silent_timespans",
+        "_start_offset",
+        "_stop_offset",
+        "_timespan_maker",
+        "_timespans",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        counter=None,
+        cursor_indices=None,
+        division_mask_seed=0,
+        latest_stop_offset=None,
+        layer=None,
+        made_timespans=None,
+        music_specifiers=None,
+        resume_offset=None,
+        silenced_context_names=None,
+        silent_timespans=None,
+        start_offset=None,
+        stop_offset=None,
+        timespan_maker=None,
+        timespans=None,
+    ):
+        self._counter = dict(counter or {})
+        assert len(cursor_indices) == 4, repr(cursor_indices)
+        self._cursor_indices = tuple(cursor_indices)
+        self._division_mask_seed = int(division_mask_seed)
+        if latest_stop_offset is not None:
+            latest_stop_offset = abjad.Offset(latest_stop_offset)
+        self._latest_stop_offset = latest_stop_offset
+        self._layer = layer
+        self._made_timespans = tuple(made_timespans or ())
+        self._music_specifiers = music_specifiers
+        self._resume_offset = abjad.Offset(resume_offset)
+        if silenced_context_names is not None:
+            silenced_context_names = tuple(silenced_context_names)
+        self._silenced_context_names = silenced_context_names
+        self._silent_timespans = tuple(silent_timespans or ())
+        self._start_offset = abjad.Offset(start_offset)
+        self._stop_offset = abjad.Offset(stop_offset)
+        self._timespan_maker = timespan_maker
+        self._timespans = tuple(timespans or ())
+
+    def __str__(self):
+        return abjad.storage(self)
+
+    def __repr__(self):
+        return abjad.storage(self)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def counter(self):
+        r"""
+        Gets music specifier seed of each context.
+        """
+        return dict(self._counter)
+
+    @property
+    def cursor_indices(self):
+        r"""
+        Gets indices of initial silence talea, playing talea, playing
+        groupings and silence talea cursors.
+        """
+        return self._cursor_indices
+
+    @property
+    def division_mask_seed(self):
+        r"""
+        Gets division mask seed.
+        """
+        return self._division_mask_seed
+
+    @property
+    def latest_stop_offset(self):
+        r"""
+        Gets latest stop offset made before resume offset, with synchronized
+        steps.
+        """
+        return self._latest_stop_offset
+
+    @property
+    def layer(self):
+        r"""
+        Gets layer.
+        """
+        return self._layer
+
+    @property
+    def made_timespans(self):
+        r"""
+        Gets timespans made by the run before silences were added, when
+        contexts are silenced.
+        """
+        return self._made_timespans
+
+    @property
+    def music_specifiers(self):
+        r"""
+        Gets music specifiers by context name.
+        """
+        return self._music_specifiers
+
+    @property
+    def resume_offset(self):
+        r"""
+        Gets offset where a resumed run starts.
+        """
+        return self._resume_offset
+
+    @property
+    def silenced_context_names(self):
+        r"""
+        Gets silenced context names.
+        """
+        return self._silenced_context_names
+
+    @property
+    def silent_timespans(self):
+        r"""
+        Gets silences made over the run, which a resumed run replaces.
+        """
+        return self._silent_timespans
+
+    @property
+    def start_offset(self):
+        r"""
+        Gets start offset of target timespan.
+        """
+        return self._start_offset
+
+    @property
+    def stop_offset(self):
+        r"""
+        Gets stop offset of target timespan.
+        """
+        return self._stop_offset
+
+    @property
+    def timespan_maker(self):
+        r"""
+        Gets timespan maker.
+        """
+        return self._timespan_maker
+
+    @property
+    def timespans(self):
+        r"""
+        Gets timespans made from resume offset, which a resumed run
+        replaces.
+        """
+        return self._timespans
@@ -0,0 +1,373 @@
+import heapq
+import random
+
+import abjad
+
+from .sorting import _get_sort_key
+
+
+class _IntervalNode(object):
+
+    __slots__ = (
+        "key",
+        "left",
+        "maximum",
+        "priority",
+        "right",
+        "timespan",
+    )
+
+    def __init__(self, key, priority, timespan):
+        self.key = key
+        self.left = None
+        self.maximum = key[1]
+        self.priority = priority
+        self.right = None
+        self.timespan = timespan
+
+
+class TimespanIntervalTree(object):
+    r"""
+    A timespan interval tree.
+
+    Keeps one augmented interval tree per voice name. Each tree is ordered by
+    start offset, stop offset and insertion order, and each node records the
+    latest stop offset beneath it, so overlap queries visit only the
+    branches which can hold overlapping timespans.
+
+    ``subtract()`` and ``intersect()`` change the tree in place, like
+    subtraction and intersection on ``abjad.TimespanList``, and touch only
+    the overlapping timespans.
+
+    ..  container:: example
+
+        >>> timespans = tsmakers.TimespanIntervalTree(
+        ...     [
+        ...         tsmakers.PerformedTimespan(0, 4, voice_name="Violin"),
+        ...         tsmakers.PerformedTimespan(5, 8, voice_name="Violin"),
+        ...         tsmakers.PerformedTimespan(2, 6, voice_name="Cello"),
+        ...     ]
+        ... )
+        >>> len(timespans)
+        3
+
+        >>> for timespan in timespans.find_overlapping(
+        ...     abjad.Timespan(3, 6), voice_name="Violin"
+        ... ):
+        ...     timespan
+        ...
+        tsmakers.PerformedTimespan(
+            start_offset=abjad.Offset((0, 1)),
+            stop_offset=abjad.Offset((4, 1)),
+            voice_name='Violin',
+            )
+        tsmakers.PerformedTimespan(
+            start_offset=abjad.Offset((5, 1)),
+            stop_offset=abjad.Offset((8, 1)),
+            voice_name='Violin',
+            )
+
+    ..  container:: example
+
+        Subtracts a timespan from every voice:
+
+        >>> timespans = timespans.subtract(abjad.Timespan(3, 6))
+        >>> for timespan in timespans:
+        ...     timespan.start_offset, timespan.stop_offset, timespan.voice_name
+        ...
+        (Offset((0, 1)), Offset((3, 1)), 'Violin')
+        (Offset((2, 1)), Offset((3, 1)), 'Cello')
+        (Offset((6, 1)), Offset((8, 1)), 'Violin')
+
+    ..  container:: example
+
+        Keeps material that intersects a timespan:
+
+        >>> timespans = timespans.intersect(abjad.Timespan(1, 7))
+        >>> for timespan in timespans.to_timespan_list(voice_name="Violin"):
+        ...     timespan.start_offset, timespan.stop_offset
+        ...
+        (Offset((1, 1)), Offset((3, 1)))
+        (Offset((6, 1)), Offset((7, 1)))
+
+        >>> timespans.voice_names
+        ('Violin', 'Cello')
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_counts",
+        "_random",
+        "_roots",
+        "_serial",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        self._counts = {}
+        self._random = random.Random(0)
+        self._roots = {}
+        self._serial = 0
+        if timespans is not None:
+            self.extend(timespans)
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        r"""
+        Iterates timespans by start offset, stop offset and insertion order.
+        """
+        iterators = [self._iterate_nodes(_) for _ in self._roots.values()]
+        for node in heapq.merge(*iterators, key=lambda _: _.key):
+            yield node.timespan
+
+    def __len__(self):
+        r"""
+        Gets number of timespans in tree.
+        """
+        return sum(self._counts.values())
+
+    def __repr__(self):
+        r"""
+        Gets interpreter representation of tree.
+        """
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _find_overlapping_nodes(root, timespan):
+        # Overlap is tested with closed offsets, which finds every timespan
+        # that could intersect ``timespan``, tangent ones included.
+        start_offset, stop_offset = _get_sort_key(timespan)[:2]
+        nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.maximum < start_offset:
+                continue
+            if node.key[0] <= stop_offset:
+                if start_offset <= node.key[1]:
+                    nodes.append(node)
+                stack.append(node.right)
+            stack.append(node.left)
+        nodes.sort(key=lambda _: _.key)
+        return nodes
+
+    def _insert(self, root, node):
+        left, right = self._split(root, node.key)
+        return self._merge(self._merge(left, node), right)
+
+    @staticmethod
+    def _iterate_nodes(root):
+        stack = []
+        node = root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def _make_node(self, timespan, serial=None):
+        if serial is None:
+            serial = self._serial
+            self._serial += 1
+        start_offset, stop_offset = _get_sort_key(timespan)[:2]
+        key = (start_offset, stop_offset, serial)
+        return _IntervalNode(key, self._random.random(), timespan)
+
+    @staticmethod
+    def _merge(left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if right.priority < left.priority:
+            left.right = TimespanIntervalTree._merge(left.right, right)
+            TimespanIntervalTree._update(left)
+            return left
+        right.left = TimespanIntervalTree._merge(left, right.left)
+        TimespanIntervalTree._update(right)
+        return right
+
+    @staticmethod
+    def _remove(root, key):
+        if root.key == key:
+            return TimespanIntervalTree._merge(root.left, root.right)
+        if key < root.key:
+            root.left = TimespanIntervalTree._remove(root.left, key)
+        else:
+            root.right = TimespanIntervalTree._remove(root.right, key)
+        TimespanIntervalTree._update(root)
+        return root
+
+    @staticmethod
+    def _split(root, key):
+        if root is None:
+            return None, None
+        if root.key < key:
+            left, right = TimespanIntervalTree._split(root.right, key)
+            root.right = left
+            TimespanIntervalTree._update(root)
+            return root, right
+        left, right = TimespanIntervalTree._split(root.left, key)
+        root.left = right
+        TimespanIntervalTree._update(root)
+        return left, root
+
+    @staticmethod
+    def _update(node):
+        maximum = node.key[1]
+        if node.left is not None and maximum < node.left.maximum:
+            maximum = node.left.maximum
+        if node.right is not None and maximum < node.right.maximum:
+            maximum = node.right.maximum
+        node.maximum = maximum
+
+    ### PUBLIC METHODS ###
+
+    def append(self, timespan):
+        r"""
+        Appends ``timespan`` to tree.
+        """
+        voice_name = getattr(timespan, "voice_name", None)
+        root = self._roots.get(voice_name)
+        self._roots[voice_name] = self._insert(root, self._make_node(timespan))
+        self._counts[voice_name] = self._counts.get(voice_name, 0) + 1
+
+    def compute_logical_or(self):
+        r"""
+        Fuses overlapping and tangent timespans of the same type in each
+        voice, like ``abjad.TimespanList.compute_logical_or()``.
+
+        Returns tree.
+        """
+        for voice_name in self._roots:
+            timespans = self.to_timespan_list(voice_name=voice_name)
+            timespans.compute_logical_or()
+            self._counts[voice_name] = len(timespans)
+            root = None
+            for timespan in timespans:
+                root = self._insert(root, self._make_node(timespan))
+            self._roots[voice_name] = root
+        return self
+
+    def extend(self, timespans):
+        r"""
+        Extends tree with ``timespans``.
+        """
+        for timespan in timespans:
+            self.append(timespan)
+
+    def find_overlapping(self, timespan, voice_name=None):
+        r"""
+        Finds timespans in voice named ``voice_name`` which intersect
+        ``timespan``.
+
+        Finds timespans in every voice when ``voice_name`` is none.
+
+        Returns list.
+        """
+        if voice_name is None:
+            roots = list(self._roots.values())
+        else:
+            roots = [self._roots.get(voice_name)]
+        nodes = []
+        for root in roots:
+            nodes.extend(
+                node
+                for node in self._find_overlapping_nodes(root, timespan)
+                if node.timespan.intersects_timespan(timespan)
+            )
+        nodes.sort(key=lambda _: _.key)
+        return [_.timespan for _ in nodes]
+
+    def intersect(self, timespan):
+        r"""
+        Keeps material that intersects ``timespan``.
+
+        Returns tree.
+        """
+        for voice_name, root in self._roots.items():
+            pieces = []
+            for node in self._find_overlapping_nodes(root, timespan):
+                if node.timespan.intersects_timespan(timespan):
+                    for piece in node.timespan & timespan:
+                        pieces.append((piece, node.key[2]))
+            self._counts[voice_name] = len(pieces)
+            root = None
+            for piece, serial in pieces:
+                root = self._insert(root, self._make_node(piece, serial))
+            self._roots[voice_name] = root
+        return self
+
+    def partition(self, include_tangent_timespans=False):
+        r"""
+        Partitions timespans into groups of overlapping timespans, like
+        ``abjad.TimespanList.partition()``.
+
+        Returns tuple of timespan lists.
+        """
+        timespan_lists = []
+        latest_stop_offset = None
+        for timespan in self:
+            start_offset = timespan.start_offset
+            if latest_stop_offset is None:
+                pass
+            elif start_offset < latest_stop_offset or (
+                include_tangent_timespans and start_offset == latest_stop_offset
+            ):
+                timespan_lists[-1].append(timespan)
+                if latest_stop_offset < timespan.stop_offset:
+                    latest_stop_offset = timespan.stop_offset
+                continue
+            timespan_lists.append(abjad.TimespanList([timespan]))
+            latest_stop_offset = timespan.stop_offset
+        return tuple(timespan_lists)
+
+    def subtract(self, timespan):
+        r"""
+        Deletes material that intersects ``timespan``.
+
+        Returns tree.
+        """
+        for voice_name, root in self._roots.items():
+            nodes = [
+                node
+                for node in self._find_overlapping_nodes(root, timespan)
+                if node.timespan.intersects_timespan(timespan)
+            ]
+            for node in nodes:
+                root = self._remove(root, node.key)
+                self._counts[voice_name] -= 1
+                for piece in node.timespan - timespan:
+                    root = self._insert(root, self._make_node(piece, node.key[2]))
+                    self._counts[voice_name] += 1
+            self._roots[voice_name] = root
+        return self
+
+    def to_timespan_list(self, voice_name=None):
+        r"""
+        Changes timespans in voice named ``voice_name`` to timespan list.
+
+        Changes timespans in every voice when ``voice_name`` is none.
+        """
+        if voice_name is None:
+            return abjad.TimespanList(list(self))
+        root = self._roots.get(voice_name)
+        return abjad.TimespanList([_.timespan for _ in self._iterate_nodes(root)])
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def voice_names(self):
+        r"""
+        Gets voice names in tree, in order of first appearance.
+        """
+        return tuple(self._roots)
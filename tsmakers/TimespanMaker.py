@@ -1,18 +1,26 @@
 import abc
+import bisect
 import collections
 
 import abjad
 
 from .CompositeMusicSpecifier import CompositeMusicSpecifier
+from .Cursor import Cursor
 from .MusicSpecifierSequence import MusicSpecifierSequence
 from .PerformedTimespan import PerformedTimespan
+from .PerformedTimespanTable import PerformedTimespanTable
 from .SilentTimespan import SilentTimespan
+from .sorting import _get_sort_key, sort_timespans
 from .TimespanSpecifier import TimespanSpecifier
 
 
 class TimespanMaker(object):
     r"""
     Abstract base class for timespan makers.
+
+    With ``tick_mode``, makers count offsets and durations in integer ticks
+    of one common denominator while making timespans, and make rational
+    offsets only for the timespans they output.
     """
 
     ### CLASS VARIABLES ###
@@ -21,6 +29,7 @@ class TimespanMaker(object):
         "_output_masks",
         "_padding",
         "_seed",
+        "_tick_mode",
         "_timespan_specifier",
     )
 
@@ -32,6 +41,7 @@ class TimespanMaker(object):
         division_masks=None,
         padding=None,
         seed=None,
+        tick_mode=None,
         timespan_specifier=None,
     ):
         if division_masks is not None:
@@ -47,6 +57,9 @@ class TimespanMaker(object):
         if seed is not None:
             seed = int(seed)
         self._seed = seed
+        if tick_mode is not None:
+            tick_mode = bool(tick_mode)
+        self._tick_mode = tick_mode
         if timespan_specifier is not None:
             assert isinstance(timespan_specifier, TimespanSpecifier)
         self._timespan_specifier = timespan_specifier
@@ -61,8 +74,40 @@ class TimespanMaker(object):
         silenced_context_names=None,
         target_timespan=None,
         timespan_list=None,
+        timespan_list_is_sorted=False,
     ):
-        if not isinstance(timespan_list, abjad.TimespanList):
+        r"""
+        Calls timespan maker.
+
+        New timespans are added to ``timespan_list``, which is then sorted.
+        Set ``timespan_list_is_sorted`` to true when ``timespan_list`` is
+        already sorted, to merge the sorted new timespans into it instead of
+        sorting the whole list again:
+
+        ..  container:: example
+
+            >>> timespan_maker = tsmakers.FloodedTimespanMaker()
+            >>> timespan_list = abjad.TimespanList()
+            >>> for voice_name in ("B", "A", "C"):
+            ...     timespan_list = timespan_maker(
+            ...         music_specifiers={voice_name: None},
+            ...         target_timespan=abjad.Timespan(0, 1),
+            ...         timespan_list=timespan_list,
+            ...         timespan_list_is_sorted=True,
+            ...     )
+            ...
+            >>> [_.voice_name for _ in timespan_list]
+            ['A', 'B', 'C']
+
+        ``timespan_list`` may be a ``PerformedTimespanTable``, which new
+        timespans are merged or sorted into the same way. Talea timespan
+        makers write their steps straight into a table then, and other
+        makers add their timespans to it once made.
+
+        Returns ``timespan_list``.
+        """
+        prototype = (abjad.TimespanList, PerformedTimespanTable)
+        if not isinstance(timespan_list, prototype):
             timespan_list = abjad.TimespanList(
                 timespan_list,
             )
@@ -71,7 +116,7 @@ class TimespanMaker(object):
                 target_timespan = timespan_list.timespan
             else:
                 raise TypeError
-        assert isinstance(timespan_list, abjad.TimespanList)
+        assert isinstance(timespan_list, prototype)
         if not music_specifiers:
             return timespan_list
         music_specifiers = self._coerce_music_specifiers(music_specifiers)
@@ -86,8 +131,15 @@ class TimespanMaker(object):
             silenced_context_names=silenced_context_names,
             timespans=new_timespans,
         )
-        timespan_list.extend(new_timespans)
-        timespan_list.sort()
+        if timespan_list_is_sorted:
+            sort_timespans(new_timespans)
+            if isinstance(timespan_list, PerformedTimespanTable):
+                timespan_list.merge(new_timespans)
+            else:
+                self._merge_timespans(timespan_list, new_timespans)
+        else:
+            timespan_list.extend(new_timespans)
+            sort_timespans(timespan_list)
         return timespan_list
 
     def __illustrate__(self, scale=None, target_timespan=None, **kwargs):
@@ -175,6 +227,8 @@ class TimespanMaker(object):
                 music_specifier = MusicSpecifierSequence(
                     music_specifiers=music_specifier,
                 )
+            elif isinstance(music_specifier, CompositeMusicSpecifier):
+                music_specifier = music_specifier.intern()
             result[context_name] = music_specifier
         return result
 
@@ -186,52 +240,171 @@ class TimespanMaker(object):
     ):
         if not silenced_context_names or not timespans:
             return
+        if layer is not None:
+            layer = int(layer)
 
         silent_timespans_by_context = {}
         for context_name in silenced_context_names:
             if context_name not in silent_timespans_by_context:
-                silent_timespans_by_context[context_name] = abjad.TimespanList()
+                silent_timespans_by_context[context_name] = []
 
         sounding_timespans_by_context = {}
-        sounding_timespans = abjad.TimespanList()
+        sounding_timespans = []
 
         for timespan in timespans:
             voice_name = timespan.voice_name
             if isinstance(timespan, PerformedTimespan):
                 if voice_name not in sounding_timespans_by_context:
-                    sounding_timespans_by_context[voice_name] = abjad.TimespanList()
+                    sounding_timespans_by_context[voice_name] = []
                 sounding_timespans_by_context[voice_name].append(timespan)
                 sounding_timespans.append(timespan)
             else:
                 if voice_name not in silent_timespans_by_context:
-                    silent_timespans_by_context[voice_name] = abjad.TimespanList()
+                    silent_timespans_by_context[voice_name] = []
                 silent_timespans_by_context[voice_name].append(timespan)
 
-        sounding_timespans.sort()
-        sounding_timespans.compute_logical_or()
-
-        # Create silences.
-        for shard in sounding_timespans.partition(True):
+        # Create silences over the union of all sounding timespans. Each
+        # silence is kept as (start, stop, template), where template is the
+        # preexisting silent timespan it was cut from, if any.
+        pieces_by_context = {
+            context_name: [(_.start_offset, _.stop_offset, _) for _ in silents]
+            for context_name, silents in silent_timespans_by_context.items()
+        }
+        for start_offset, stop_offset in self._get_offset_union(sounding_timespans):
             for context_name in silenced_context_names:
-                timespan = SilentTimespan(
-                    layer=layer,
-                    voice_name=context_name,
-                    start_offset=shard.start_offset,
-                    stop_offset=shard.stop_offset,
+                pieces_by_context[context_name].append(
+                    (start_offset, stop_offset, None)
                 )
-                silent_timespans_by_context[context_name].append(timespan)
 
-        # Remove any overlap between performed and silent timespans.
+        # Remove any overlap between performed and silent timespans, in one
+        # pass over each context's sounding union.
         # Then add the silent timespans into the original timespan inventory.
-        for context_name, silent_timespans in sorted(
-            silent_timespans_by_context.items()
-        ):
-            silent_timespans.sort()
+        for context_name, _ in sorted(silent_timespans_by_context.items()):
+            pieces = pieces_by_context[context_name]
+            pieces.sort(key=lambda _: (_[0], _[1]))
             if context_name in sounding_timespans_by_context:
-                for timespan in sounding_timespans_by_context[context_name]:
-                    silent_timespans - timespan
+                sounding_timespans = sounding_timespans_by_context[context_name]
+                attributes = set()
+                for _, __, template in pieces:
+                    if template is None:
+                        attributes.add((SilentTimespan, layer, id(None)))
+                    else:
+                        attributes.add(
+                            (type(template), template.layer, id(template.handler))
+                        )
+                if len(attributes) <= 1:
+                    union = self._get_offset_union(sounding_timespans)
+                    pieces = self._subtract_offset_union(pieces, union)
+                    pieces.sort(key=lambda _: (_[0], _[1]))
+                else:
+                    # Silences which differ in more than offsets may tie, so
+                    # cut them one sounding timespan at a time to keep their
+                    # order.
+                    for timespan in sounding_timespans:
+                        union = [(timespan.start_offset, timespan.stop_offset)]
+                        pieces = self._subtract_offset_union(pieces, union)
+                        pieces.sort(key=lambda _: (_[0], _[1]))
+                copy = True
+            else:
+                copy = False
+            silent_timespans = []
+            for start_offset, stop_offset, template in pieces:
+                if template is None:
+                    timespan = SilentTimespan(
+                        layer=layer,
+                        voice_name=context_name,
+                        start_offset=start_offset,
+                        stop_offset=stop_offset,
+                    )
+                elif copy:
+                    timespan = abjad.new(
+                        template,
+                        start_offset=start_offset,
+                        stop_offset=stop_offset,
+                    )
+                else:
+                    timespan = template
+                silent_timespans.append(timespan)
             timespans.extend(silent_timespans)
 
+    @staticmethod
+    def _get_offset_union(timespans):
+        # Sweeps timespans by start offset, fusing overlapping and tangent
+        # timespans, like compute_logical_or() followed by partition(True).
+        union = []
+        for timespan in sorted(timespans, key=_get_sort_key):
+            if union and timespan.start_offset <= union[-1][1]:
+                if union[-1][1] < timespan.stop_offset:
+                    union[-1][1] = timespan.stop_offset
+            else:
+                union.append([timespan.start_offset, timespan.stop_offset])
+        return union
+
+    @staticmethod
+    def _merge_timespans(timespans, new_timespans):
+        # Merges like a stable sort of timespans + new_timespans: on ties
+        # the timespans already in the list come first.
+        if not new_timespans:
+            return
+        new_keys = [_get_sort_key(_) for _ in new_timespans]
+        low, high = 0, len(timespans)
+        while low < high:
+            middle = (low + high) // 2
+            if new_keys[0] < _get_sort_key(timespans[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        start = low
+        old_timespans = timespans[start:]
+        old_keys = [_get_sort_key(_) for _ in old_timespans]
+        merged = []
+        i, j = 0, 0
+        while i < len(old_timespans) and j < len(new_timespans):
+            if new_keys[j] < old_keys[i]:
+                merged.append(new_timespans[j])
+                j += 1
+            else:
+                merged.append(old_timespans[i])
+                i += 1
+        merged.extend(old_timespans[i:])
+        merged.extend(new_timespans[j:])
+        timespans[start:] = merged
+
+    @staticmethod
+    def _subtract_offset_union(pieces, union):
+        # Cuts each (start, stop, template) piece around the disjoint,
+        # sorted (start, stop) pairs in union.
+        stop_offsets = [_[1] for _ in union]
+        result = []
+        for start_offset, stop_offset, template in pieces:
+            i = bisect.bisect_right(stop_offsets, start_offset)
+            while i < len(union) and union[i][0] < stop_offset:
+                if start_offset < union[i][0]:
+                    result.append((start_offset, union[i][0], template))
+                start_offset = max(start_offset, union[i][1])
+                i += 1
+            if start_offset < stop_offset:
+                result.append((start_offset, stop_offset, template))
+        return result
+
+    @staticmethod
+    def _get_tick_denominator(values):
+        # Least common multiple of the denominators of ``values``, so that
+        # every value is a whole number of ticks.
+        denominators = set(_.denominator for _ in values)
+        return abjad.math.least_common_multiple(1, *denominators)
+
+    @staticmethod
+    def _to_tick_cursor(cursor, denominator):
+        return Cursor(
+            [TimespanMaker._to_ticks(_, denominator) for _ in cursor.sequence],
+            index=cursor.index,
+        )
+
+    @staticmethod
+    def _to_ticks(value, denominator):
+        return value.numerator * (denominator // value.denominator)
+
     ### PUBLIC METHODS ###
 
     def rotate(self, rotation):
@@ -257,6 +430,10 @@ class TimespanMaker(object):
     def seed(self):
         return self._seed
 
+    @property
+    def tick_mode(self):
+        return self._tick_mode
+
     @property
     def timespan_specifier(self):
         return self._timespan_specifier
@@ -10,16 +10,27 @@ from .Cursor import Cursor
 from .DependentTimespanMaker import DependentTimespanMaker
 from .FloodedTimespanMaker import FloodedTimespanMaker
 from .HashCachingObject import HashCachingObject
+from .IndexedTimespanList import IndexedTimespanList
 from .MusicSpecifier import MusicSpecifier
 from .MusicSpecifierSequence import MusicSpecifierSequence
 from .PerformedTimespan import PerformedTimespan
+from .PerformedTimespanTable import PerformedTimespanTable
 from .SilentTimespan import SilentTimespan
+from .sorting import sort_timespans
 from .TaleaTimespanMaker import TaleaTimespanMaker
+from .TaleaTimespanMakerState import TaleaTimespanMakerState
+from .TimespanIntervalTree import TimespanIntervalTree
 from .TimespanMaker import TimespanMaker
 from .TimespanSpecifier import TimespanSpecifier
-from .tree import TimespanTree, TimespanTreeNode
+from .tree import (
+    ArrayTimespanTree,
+    SharedTimespanTree,
+    TimespanTree,
+    TimespanTreeNode,
+)
 
 __all__ = [
+    "ArrayTimespanTree",
     "BoundaryTimespanMaker",
     "CascadingTimespanMaker",
     "CompositeMusicSpecifier",
@@ -27,13 +38,19 @@ __all__ = [
     "DependentTimespanMaker",
     "FloodedTimespanMaker",
     "HashCachingObject",
+    "IndexedTimespanList",
     "MusicSpecifier",
     "MusicSpecifierSequence",
     "PerformedTimespan",
+    "PerformedTimespanTable",
+    "SharedTimespanTree",
     "SilentTimespan",
     "TaleaTimespanMaker",
+    "TaleaTimespanMakerState",
+    "TimespanIntervalTree",
     "TimespanMaker",
     "TimespanSpecifier",
     "TimespanTree",
     "TimespanTreeNode",
+    "sort_timespans",
 ]
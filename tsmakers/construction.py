@@ -0,0 +1,70 @@
+"""
+Internal helpers which make timespans from offsets known to be valid.
+
+abjad.Timespan.__init__() validates and coerces its offsets, which is slow
+when making many timespans. These helpers set abjad.Timespan's private slots
+directly instead, but only when a one-time check at import finds the slot
+layout they expect. Otherwise they call abjad.Timespan.__init__().
+"""
+import abjad
+
+_slot_names = ("_expression", "_start_offset", "_stop_offset")
+
+
+def _get_slot_names(class_):
+    slot_names = set()
+    for base in class_.__mro__[:-1]:
+        if "__slots__" not in vars(base):
+            return None
+        slots = base.__slots__
+        slot_names.update((slots,) if isinstance(slots, str) else slots)
+    return slot_names
+
+
+def _can_set_slots():
+    if _get_slot_names(abjad.Timespan) != set(_slot_names):
+        return False
+    start_offset, stop_offset = abjad.Offset(1, 4), abjad.Offset(3, 4)
+    try:
+        timespan = abjad.Timespan.__new__(abjad.Timespan)
+        for slot_name, value in zip(_slot_names, (None, start_offset, stop_offset)):
+            setattr(timespan, slot_name, value)
+        return (
+            timespan == abjad.Timespan(start_offset, stop_offset)
+            and timespan.start_offset == start_offset
+            and timespan.stop_offset == stop_offset
+        )
+    except Exception:
+        return False
+
+
+_slots_are_settable = _can_set_slots()
+
+
+def new_timespan(class_, start_offset, stop_offset):
+    """
+    Makes ``class_`` instance from ``start_offset`` and ``stop_offset``
+    without calling ``class_.__init__()``.
+
+    Offsets must be ``abjad.Offset`` instances with ``start_offset`` not after
+    ``stop_offset``. Slots ``class_`` adds to ``abjad.Timespan`` are left for
+    the caller to set.
+    """
+    timespan = class_.__new__(class_)
+    set_offsets(timespan, start_offset, stop_offset)
+    return timespan
+
+
+def set_offsets(timespan, start_offset, stop_offset):
+    """
+    Sets offsets of ``timespan`` to ``start_offset`` and ``stop_offset``.
+
+    Offsets must be ``abjad.Offset`` instances with ``start_offset`` not after
+    ``stop_offset``.
+    """
+    if _slots_are_settable:
+        timespan._expression = None
+        timespan._start_offset = start_offset
+        timespan._stop_offset = stop_offset
+    else:
+        abjad.Timespan.__init__(timespan, start_offset, stop_offset)
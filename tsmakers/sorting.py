@@ -0,0 +1,83 @@
+import abjad
+import quicktions
+
+
+def _get_offset_key(offset):
+    # Infinite offsets compare as floats, which order them around fractions.
+    if isinstance(offset, (abjad.Infinity, abjad.NegativeInfinity)):
+        return float(offset)
+    return quicktions.Fraction(offset.numerator, offset.denominator)
+
+
+def _get_sort_key(timespan):
+    try:
+        return timespan.sort_key
+    except AttributeError:
+        return (
+            _get_offset_key(timespan.start_offset),
+            _get_offset_key(timespan.stop_offset),
+            "",
+        )
+
+
+def make_sort_key(start_offset, stop_offset, voice_name):
+    r"""
+    Makes sort key of timespan with ``start_offset``, ``stop_offset`` and
+    ``voice_name``.
+
+    ..  container:: example
+
+        >>> tsmakers.sorting.make_sort_key(
+        ...     abjad.Offset(1, 4), abjad.Offset(1, 2), "Violin"
+        ... )
+        (Fraction(1, 4), Fraction(1, 2), 'Violin')
+
+    Offsets are stored as plain fractions, which compare faster than
+    offsets, and infinite offsets as infinite floats. A missing voice name
+    sorts first.
+    """
+    if voice_name is None:
+        voice_name = ""
+    return (
+        _get_offset_key(start_offset),
+        _get_offset_key(stop_offset),
+        voice_name,
+    )
+
+
+def sort_timespans(timespans):
+    r"""
+    Sorts ``timespans`` in place by start offset, stop offset and voice name.
+
+    ..  container:: example
+
+        >>> timespans = abjad.TimespanList(
+        ...     [
+        ...         tsmakers.PerformedTimespan(0, 2, voice_name="B"),
+        ...         tsmakers.SilentTimespan(0, 2, voice_name="A"),
+        ...         tsmakers.PerformedTimespan(0, 1, voice_name="C"),
+        ...     ]
+        ... )
+        >>> timespans = tsmakers.sort_timespans(timespans)
+        >>> for timespan in timespans:
+        ...     timespan.sort_key
+        ...
+        (Fraction(0, 1), Fraction(1, 1), 'C')
+        (Fraction(0, 1), Fraction(2, 1), 'A')
+        (Fraction(0, 1), Fraction(2, 1), 'B')
+
+    Uses each timespan's cached ``sort_key``. Timespans without one sort as
+    if they had no voice name. The sort is stable. Performed timespan
+    tables sort their rows by the same keys.
+
+    Timespans with equal offsets may come out in another order than from
+    ``TimespanList.sort()``, which compares silent timespans without their
+    voice names.
+
+    Returns ``timespans``.
+    """
+    if isinstance(timespans, (list, abjad.TypedList)):
+        timespans.sort(key=_get_sort_key)
+    else:
+        timespans.sort()
+    return timespans
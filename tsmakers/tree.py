@@ -1,15 +1,183 @@
+import array
+import bisect
+import collections
+import heapq
+import math
+
 import abjad
 import quicktions
 
+from .construction import new_timespan
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _coerce_rules(rulelst):
+    rules = list(rulelst)
+    if rules and not isinstance(rules[0], (list, tuple)):
+        rules = [rules]
+    coerced_rules = []
+    for divisor, values in rules:
+        rule = (int(divisor), tuple(values))
+        if rule[0] <= 0 or not all(0 < value for value in rule[1]):
+            message = f"rule {(divisor, values)!r} needs a positive divisor"
+            message += " and positive values."
+            raise ValueError(message)
+        coerced_rules.append(rule)
+    return coerced_rules
+
+
+def _rewrite(value, rules, cache):
+    if value not in cache:
+        cache[value] = ()
+        for divisor, values in rules:
+            if value % divisor == 0:
+                cache[value] = values
+                break
+    return cache[value]
+
+
+def divrewrite(tr, rulelst, generations=1, node_budget=None):
+    r"""
+    Grows ``tr`` by rewriting its leaves with ``rulelst``.
+
+    ``rulelst`` is one ``(divisor, values)`` rule or a list of them. A leaf
+    whose value is divisible by a rule's divisor gets one child per value;
+    the first matching rule wins. Each generation rewrites the leaves made
+    by the one before, up to ``generations`` generations (``None`` means
+    until no rule matches). A generation that would take the tree past
+    ``node_budget`` nodes is not applied. Rules need a positive divisor and
+    positive values, and ``generations`` or ``node_budget`` must be given.
+
+    Each value's children are looked up once, but every rewritten node is
+    built. ``SharedTimespanTree.from_rules()`` shares equal subtrees instead.
 
-def divrewrite(tr, rulelst):
-    rl = [rulelst]
-    for nde in tr.levelorder:
-        for rule in rl:
-            if nde.value % rule[0] == 0:
-                for val in rule[1]:
-                    nde.insert_child(val)
-    return TimespanTree()
+    ..  container:: example
+
+        >>> root = tsmakers.TimespanTreeNode(10)
+        >>> tree = tsmakers.tree.divrewrite(
+        ...     tsmakers.TimespanTree(root),
+        ...     [(2, [8, 5]), (5, [1, 1])],
+        ...     generations=3,
+        ... )
+        >>> tree.get_level_order_value()
+        [[10], [8, 5], [8, 5, 1, 1], [8, 5, 1, 1]]
+
+        >>> tree = tsmakers.tree.divrewrite(tree, (2, [3, 1]), node_budget=14)
+        >>> tree.get_level_order_value()
+        [[10], [8, 5], [8, 5, 1, 1], [8, 5, 1, 1], [3, 1]]
+
+        >>> tsmakers.tree.divrewrite(tree, (2, [1, -1]))
+        Traceback (most recent call last):
+            ...
+        ValueError: rule (2, [1, -1]) needs a positive divisor and positive values.
+
+        >>> tsmakers.tree.divrewrite(tree, (2, [3, 1]), generations=None)
+        Traceback (most recent call last):
+            ...
+        ValueError: generations or node budget is required.
+
+    Returns timespan tree.
+    """
+    if generations is None and node_budget is None:
+        raise ValueError("generations or node budget is required.")
+    root = getattr(tr, "root", tr)
+    rules = _coerce_rules(rulelst)
+    cache = {}
+    nodes = levelorder(root)
+    node_count = len(nodes)
+    frontier = [node for node in nodes if not node.children]
+    generation = 0
+    while frontier and (generations is None or generation < generations):
+        rewrites = [(node, _rewrite(node.value, rules, cache)) for node in frontier]
+        new_node_count = sum(len(values) for _, values in rewrites)
+        if not new_node_count:
+            break
+        if node_budget is not None and node_budget < node_count + new_node_count:
+            break
+        frontier = []
+        for node, values in rewrites:
+            for value in values:
+                node.insert_child(value)
+            frontier.extend(node.children)
+        node_count += new_node_count
+        generation += 1
+    if isinstance(tr, TimespanTree):
+        return tr
+    return TimespanTree(root)
+
+
+def divrewrite_levels(value, rulelst, generations=None, node_budget=None):
+    r"""
+    Iterates the levels grown from ``value`` by ``rulelst`` as timespan
+    lists.
+
+    Rules, ``generations`` and ``node_budget`` work as in ``divrewrite()``,
+    but no tree is built: only the current level is held, and the relative
+    layout of each rewritten value is computed once.
+
+    ..  container:: example
+
+        >>> for timespans in tsmakers.tree.divrewrite_levels(
+        ...     4,
+        ...     [(2, [2, 1, 1])],
+        ...     generations=2,
+        ... ):
+        ...     [str(_.duration) for _ in timespans]
+        ...
+        ['4']
+        ['2', '1', '1']
+        ['1', '1/2', '1/2']
+
+    """
+    if generations is None and node_budget is None:
+        raise ValueError("generations or node budget is required.")
+    rules = _coerce_rules(rulelst)
+    cache = {}
+    layouts = {}
+    frontier = [(value, 0, value)]
+    node_count = 1
+    generation = 0
+    while True:
+        yield abjad.TimespanList(
+            [
+                abjad.Timespan(offset, offset + duration)
+                for _, offset, duration in frontier
+            ]
+        )
+        if generations is not None and generations <= generation:
+            break
+        next_frontier = []
+        for value, offset, duration in frontier:
+            if value not in layouts:
+                values = _rewrite(value, rules, cache)
+                total = tally(values)
+                layout = []
+                start = 0
+                for child_value in values:
+                    layout.append(
+                        (
+                            child_value,
+                            quicktions.Fraction(start, total),
+                            quicktions.Fraction(child_value, total),
+                        )
+                    )
+                    start += child_value
+                layouts[value] = tuple(layout)
+            for child_value, start, width in layouts[value]:
+                next_frontier.append(
+                    (child_value, offset + start * duration, width * duration)
+                )
+        if not next_frontier:
+            break
+        if node_budget is not None and node_budget < node_count + len(next_frontier):
+            break
+        node_count += len(next_frontier)
+        generation += 1
+        frontier = next_frontier
 
 
 def flatten(lst):
@@ -20,27 +188,95 @@ def flatten(lst):
     return out
 
 
+def iterate_depths(root):
+    r"""
+    Iterates ``(depth, node)`` pairs of ``root`` in level order.
+
+    ..  container:: example
+
+        >>> root = tsmakers.TimespanTreeNode(2)
+        >>> root.insert_child(1)
+        >>> root.insert_child(1)
+        >>> root.children[0].insert_child(3)
+        >>> for depth, node in tsmakers.tree.iterate_depths(root):
+        ...     depth, node.value
+        ...
+        (0, 2)
+        (1, 1)
+        (1, 1)
+        (2, 3)
+
+    """
+    queue = collections.deque([(0, root)])
+    while queue:
+        depth, node = queue.popleft()
+        yield depth, node
+        depth += 1
+        queue.extend((depth, child) for child in node.children)
+
+
+def iterate_levelorder(root):
+    r"""
+    Iterates the nodes of ``root`` in level order.
+
+    Nodes are yielded as they leave the queue, so the traversal can stop
+    early without visiting the rest of the tree.
+
+    ..  container:: example
+
+        >>> root = tsmakers.TimespanTreeNode(2)
+        >>> root.insert_child(1)
+        >>> root.insert_child(1)
+        >>> root.children[0].insert_child(3)
+        >>> for node in tsmakers.tree.iterate_levelorder(root):
+        ...     node.value
+        ...
+        2
+        1
+        1
+        3
+
+    """
+    queue = collections.deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node
+        queue.extend(node.children)
+
+
+def iterate_levels(root):
+    r"""
+    Iterates the levels of ``root`` as lists of nodes.
+
+    Each level is built from the one above it, so only one level is held at
+    a time.
+
+    ..  container:: example
+
+        >>> root = tsmakers.TimespanTreeNode(2)
+        >>> root.insert_child(1)
+        >>> root.insert_child(1)
+        >>> root.children[0].insert_child(3)
+        >>> for level in tsmakers.tree.iterate_levels(root):
+        ...     [node.value for node in level]
+        ...
+        [2]
+        [1, 1]
+        [3]
+
+    """
+    level = [root]
+    while level:
+        yield level
+        level = [child for node in level for child in node.children]
+
+
 def levelbylevel(root):
-    out = []
-    q = [root, None]
-    while len(q) > 1:
-        for i in q[: q.index(None)]:
-            q.extend(i.children)
-        out.append(q[: q.index(None)])
-        del q[: q.index(None) + 1]
-        q.extend([None])
-    return out
+    return list(iterate_levels(root))
 
 
 def levelorder(root):
-    out = []
-    q = []
-    q.append(root)
-    while len(q) != 0:
-        q.extend(q[0].children)
-        out.append(q[0])
-        q.pop(0)
-    return out
+    return list(iterate_levelorder(root))
 
 
 def tally(lst):
@@ -51,13 +287,44 @@ def tally(lst):
 
 
 class TimespanTreeNode(object):
+
+    # Edits are stamped with the current global epoch. Each TimespanTree
+    # remembers the epoch it last synchronized at and advances it, so any
+    # number of trees can share nodes without consuming each other's change
+    # marks.
+    _global_epoch = 1
+
     def __init__(self, num=1, parent=None):
-        self.value = num
+        self._value = num
         self.children = []
         self.parent = parent
+        self._descendant_edit_epoch = 0
+        self._edit_epoch = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, num):
+        self._value = num
+        # A weight rescales its siblings, so the parent's subtree is stale.
+        if self.parent is None:
+            self._mark_dirty()
+        else:
+            self.parent._mark_dirty()
+
+    def _mark_dirty(self):
+        epoch = TimespanTreeNode._global_epoch
+        self._edit_epoch = epoch
+        node = self.parent
+        while node is not None and node._descendant_edit_epoch != epoch:
+            node._descendant_edit_epoch = epoch
+            node = node.parent
 
     def insert_child(self, num):
         self.children.append(TimespanTreeNode(num, parent=self))
+        self._mark_dirty()
 
     def get_children(self):
         return self.children
@@ -418,12 +685,202 @@ class TimespanTree(object):
                     ]
                 )
 
+    ..  container:: example
+
+        Edits made through ``insert_child()`` or ``value`` after the tree is
+        built are picked up lazily. Only the edited subtrees are traversed
+        again:
+
+        >>> a = tsmakers.TimespanTreeNode(4)
+        >>> a.insert_child(1)
+        >>> a.insert_child(1)
+        >>> b, c = a.children
+        >>> tree = tsmakers.TimespanTree(a)
+        >>> tree.get_level_order_value()
+        [[4], [1, 1]]
+
+        >>> c.insert_child(1)
+        >>> c.insert_child(3)
+        >>> b.value = 3
+        >>> tree.get_level_order_value()
+        [[4], [3, 1], [1, 3]]
+
+        >>> for timespan in tree.tspanlist_level(2):
+        ...     timespan
+        ...
+        Timespan(Offset((3, 1)), Offset((13, 4)))
+        Timespan(Offset((13, 4)), Offset((4, 1)))
+
+    ..  container:: example
+
+        A tree rooted at a node with a parent also picks up edits outside
+        its subtree which rescale or move its root:
+
+        >>> a = tsmakers.TimespanTreeNode(4)
+        >>> a.insert_child(1)
+        >>> a.insert_child(1)
+        >>> b, c = a.children
+        >>> b.insert_child(1)
+        >>> b.insert_child(1)
+        >>> b_tree = tsmakers.TimespanTree(b)
+        >>> c_tree = tsmakers.TimespanTree(c)
+        >>> b_tree.tspanlist()[0]
+        Timespan(Offset((0, 1)), Offset((2, 1)))
+
+        >>> c_tree.tspanlist()[0]
+        Timespan(Offset((2, 1)), Offset((4, 1)))
+
+        >>> c.value = 3
+        >>> b_tree.tspanlist()[0]
+        Timespan(Offset((0, 1)), Offset((1, 1)))
+
+        >>> c_tree.tspanlist()[0]
+        Timespan(Offset((1, 1)), Offset((4, 1)))
+
     """
 
     def __init__(self, root):
         self.root = root
-        self.levelorder = levelorder(root)
-        self.levelbylevel = levelbylevel(root)
+        self._child_offsets = {}
+        self._durations = {root: root.get_real_value()}
+        self._indices = {}
+        self._levelbylevel = []
+        self._levelorder = None
+        self._offsets = {root: root.offset()}
+        self._synchronized_epoch = TimespanTreeNode._global_epoch
+        TimespanTreeNode._global_epoch += 1
+        for level in iterate_levels(root):
+            self._levelbylevel.append(level)
+            for index, node in enumerate(level):
+                self._indices[node] = index
+        self._compute_offsets(self._levelbylevel)
+
+    @property
+    def levelbylevel(self):
+        self._update()
+        return self._levelbylevel
+
+    @property
+    def levelorder(self):
+        self._update()
+        if self._levelorder is None:
+            self._levelorder = flatten(self._levelbylevel)
+        return self._levelorder
+
+    def _collect_dirty_nodes(self):
+        epoch = self._synchronized_epoch
+        dirty_nodes = []
+        stack = [(0, self.root)]
+        while stack:
+            depth, node = stack.pop()
+            if epoch < node._edit_epoch:
+                dirty_nodes.append((depth, node))
+            elif epoch < node._descendant_edit_epoch:
+                stack.extend((depth + 1, child) for child in node.children)
+        return dirty_nodes
+
+    def _compute_offsets(self, levels):
+        durations, offsets = self._durations, self._offsets
+        for level in levels:
+            for node in level:
+                if not node.children:
+                    continue
+                total = node.get_childrensum()
+                duration = durations[node]
+                offset = offsets[node]
+                for child in node.children:
+                    child_duration = quicktions.Fraction(child.value, total) * duration
+                    durations[child] = child_duration
+                    offsets[child] = offset
+                    offset += child_duration
+
+    def _find_child_range(self, node, start_offset, stop_offset):
+        if node not in self._child_offsets:
+            self._child_offsets[node] = [self._offsets[_] for _ in node.children]
+        offsets = self._child_offsets[node]
+        start = max(bisect.bisect_right(offsets, start_offset) - 1, 0)
+        stop = bisect.bisect_left(offsets, stop_offset)
+        return start, stop
+
+    def _find_child_run(self, level, start, stop):
+        # Nodes in a level are ordered by their parent's index in the level
+        # above, so the children of parents [start, stop) form one run.
+        indices = self._indices
+        bounds = []
+        for parent_index in (start, stop):
+            low, high = 0, len(level)
+            while low < high:
+                middle = (low + high) // 2
+                if indices[level[middle].parent] < parent_index:
+                    low = middle + 1
+                else:
+                    high = middle
+            bounds.append(low)
+        return bounds
+
+    def _get_timespan(self, node):
+        self._update()
+        offset = self._offsets[node]
+        return abjad.Timespan(offset, offset + self._durations[node])
+
+    def _ancestors_are_dirty(self):
+        # Edits that rescale a node mark one of its ancestors, so a root with
+        # a parent is stale when any of its ancestors was edited.
+        epoch = self._synchronized_epoch
+        node = self.root.parent
+        while node is not None:
+            if epoch < node._edit_epoch:
+                return True
+            node = node.parent
+        return False
+
+    def _update(self):
+        epoch = self._synchronized_epoch
+        ancestors_are_dirty = self._ancestors_are_dirty()
+        if (
+            not ancestors_are_dirty
+            and self.root._edit_epoch <= epoch
+            and self.root._descendant_edit_epoch <= epoch
+        ):
+            return
+        for depth, node in self._collect_dirty_nodes():
+            self._update_subtree(depth, node)
+        if ancestors_are_dirty:
+            self._durations[self.root] = self.root.get_real_value()
+            self._offsets[self.root] = self.root.offset()
+            self._compute_offsets(self._levelbylevel)
+        self._child_offsets.clear()
+        self._levelorder = None
+        self._synchronized_epoch = TimespanTreeNode._global_epoch
+        TimespanTreeNode._global_epoch += 1
+
+    def _update_subtree(self, depth, node):
+        levels = self._levelbylevel
+        new_levels = levelbylevel(node)
+        runs = [(self._indices[node], self._indices[node] + 1)]
+        for level in levels[depth + 1 : depth + len(new_levels)]:
+            runs.append(self._find_child_run(level, *runs[-1]))
+        for offset, new_level in enumerate(new_levels):
+            if offset == 0:
+                continue
+            if depth + offset == len(levels):
+                levels.append([])
+            level = levels[depth + offset]
+            if offset < len(runs):
+                start, stop = runs[offset]
+            else:
+                start = stop = len(level)
+            # Nodes after the edited run keep their indices unless its length
+            # changes, so value edits cost the size of the edited subtree.
+            # Inserting or removing nodes shifts the rest of the level.
+            resized = len(new_level) != stop - start
+            level[start:stop] = new_level
+            stop = len(level) if resized else start + len(new_level)
+            for index in range(start, stop):
+                self._indices[level[index]] = index
+        if node is self.root:
+            self._durations[node] = node.get_real_value()
+        self._compute_offsets(new_levels)
 
     def get_level_order(self):
         return self.levelorder
@@ -437,18 +894,971 @@ class TimespanTree(object):
     def get_level_value(self, n):
         return [i.value for i in self.levelbylevel[n]]
 
+    def iterate_depths(self):
+        for depth, level in enumerate(self.levelbylevel):
+            for node in level:
+                yield depth, node
+
+    def iterate_timespans(self, start_offset=None, stop_offset=None):
+        r"""
+        Iterates timespans in start offset order.
+
+        Nodes starting at the same offset are yielded parents first. Offsets
+        are computed while walking the tree, and at most one pending sibling
+        per level is held in memory. ``start_offset`` and ``stop_offset``
+        limit the walk to timespans overlapping that window; subtrees
+        outside of it are skipped.
+
+        ..  container:: example
+
+            >>> a = tsmakers.TimespanTreeNode(4)
+            >>> a.insert_child(1)
+            >>> a.insert_child(1)
+            >>> for child in a.children:
+            ...     child.insert_child(1)
+            ...     child.insert_child(3)
+            ...
+            >>> tree = tsmakers.TimespanTree(a)
+            >>> for timespan in tree.iterate_timespans():
+            ...     timespan
+            ...
+            Timespan(Offset((0, 1)), Offset((4, 1)))
+            Timespan(Offset((0, 1)), Offset((2, 1)))
+            Timespan(Offset((0, 1)), Offset((1, 2)))
+            Timespan(Offset((1, 2)), Offset((2, 1)))
+            Timespan(Offset((2, 1)), Offset((4, 1)))
+            Timespan(Offset((2, 1)), Offset((5, 2)))
+            Timespan(Offset((5, 2)), Offset((4, 1)))
+
+            >>> for timespan in tree.iterate_timespans(
+            ...     start_offset=abjad.Offset(1),
+            ...     stop_offset=abjad.Offset(5, 2),
+            ... ):
+            ...     timespan
+            ...
+            Timespan(Offset((0, 1)), Offset((4, 1)))
+            Timespan(Offset((0, 1)), Offset((2, 1)))
+            Timespan(Offset((1, 2)), Offset((2, 1)))
+            Timespan(Offset((2, 1)), Offset((4, 1)))
+            Timespan(Offset((2, 1)), Offset((5, 2)))
+
+        """
+        root = self.root
+        # Entries are (start, depth, sequence, stop, node, index, scale),
+        # where ``index`` is the node's index among its siblings and
+        # ``scale`` is the parent's duration per unit of child value.
+        heap = [(0, 0, 0, root.get_real_value(), root, 0, None)]
+        sequence = 1
+        while heap:
+            start, depth, _, stop, node, index, scale = heapq.heappop(heap)
+            if stop_offset is not None and stop_offset <= start:
+                break
+            if node.parent is not None and index + 1 < len(node.parent.children):
+                sibling = node.parent.children[index + 1]
+                heapq.heappush(
+                    heap,
+                    (
+                        stop,
+                        depth,
+                        sequence,
+                        stop + sibling.value * scale,
+                        sibling,
+                        index + 1,
+                        scale,
+                    ),
+                )
+                sequence += 1
+            if start_offset is not None and stop <= start_offset:
+                continue
+            yield abjad.Timespan(start, stop)
+            if node.children:
+                child = node.children[0]
+                child_scale = quicktions.Fraction(stop - start) / node.get_childrensum()
+                heapq.heappush(
+                    heap,
+                    (
+                        start,
+                        depth + 1,
+                        sequence,
+                        start + child.value * child_scale,
+                        child,
+                        0,
+                        child_scale,
+                    ),
+                )
+                sequence += 1
+
+    def get_duration(self, node):
+        self._update()
+        return self._durations[node]
+
+    def get_offset(self, node):
+        self._update()
+        return self._offsets[node]
+
     def replace_values(self, lst):
         for i, j in zip(self.levelorder, lst):
             i.value = j
 
     def tspanlist_level(self, n):
-        return abjad.TimespanList([i.get_timespan() for i in self.get_level(n)])
+        return abjad.TimespanList([self._get_timespan(i) for i in self.get_level(n)])
 
-    def tspanlist(self):
-        return abjad.TimespanList([i.get_timespan() for i in self.levelorder])
+    def tspanlist_window(self, timespan):
+        r"""
+        Gets timespans intersecting ``timespan``, in level order.
+
+        Only subtrees overlapping ``timespan`` are visited, and the children
+        overlapping it are found by bisection, so a query costs about the
+        size of its output plus the depth of the tree.
+
+        ..  container:: example
+
+            >>> a = tsmakers.TimespanTreeNode(4)
+            >>> a.insert_child(1)
+            >>> a.insert_child(1)
+            >>> for child in a.children:
+            ...     child.insert_child(1)
+            ...     child.insert_child(3)
+            ...
+            >>> tree = tsmakers.TimespanTree(a)
+            >>> for timespan in tree.tspanlist_window(abjad.Timespan(1, 5)):
+            ...     timespan
+            ...
+            Timespan(Offset((0, 1)), Offset((4, 1)))
+            Timespan(Offset((0, 1)), Offset((2, 1)))
+            Timespan(Offset((2, 1)), Offset((4, 1)))
+            Timespan(Offset((1, 2)), Offset((2, 1)))
+            Timespan(Offset((2, 1)), Offset((5, 2)))
+            Timespan(Offset((5, 2)), Offset((4, 1)))
+
+            >>> tree.tspanlist_window(abjad.Timespan(1, 5)) == abjad.TimespanList(
+            ...     [
+            ...         _
+            ...         for _ in tree.tspanlist()
+            ...         if _.intersects_timespan(abjad.Timespan(1, 5))
+            ...     ]
+            ... )
+            True
+
+        """
+        self._update()
+        start_offset = timespan.start_offset
+        stop_offset = timespan.stop_offset
+        durations, offsets = self._durations, self._offsets
+        timespans = []
+        frontier = [self.root]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                offset = offsets[node]
+                if stop_offset <= offset or offset + durations[node] <= start_offset:
+                    continue
+                timespans.append(self._get_timespan(node))
+                start, stop = self._find_child_range(node, start_offset, stop_offset)
+                next_frontier.extend(node.children[start:stop])
+            frontier = next_frontier
+        return abjad.TimespanList(timespans)
+
+    def tspanlist(self, vectorized=False, check=False):
+        if vectorized:
+            return ArrayTimespanTree(self.root).tspanlist(vectorized=True, check=check)
+        return abjad.TimespanList([self._get_timespan(i) for i in self.levelorder])
+
+    def show(self):
+        abjad.show(self.tspanlist(), scale=0.7)
+
+    def show_level(self, n):
+        abjad.show(self.tspanlist_level(n), scale=0.7)
+
+
+class ArrayTimespanTree(object):
+    r"""
+    A timespan tree stored as parallel arrays.
+
+    Nodes are numbered in level order. Each node is one slot in the parent,
+    first-child, next-sibling and value arrays, so the tree holds no
+    per-node Python objects. The API follows ``TimespanTree``, with node
+    indices in place of ``TimespanTreeNode`` objects: methods take indices,
+    and levels are ranges of indices.
+
+    ..  container:: example
+
+        >>> a = tsmakers.TimespanTreeNode(10)
+        >>> a.insert_child(2)
+        >>> a.insert_child(3)
+        >>> a.children[0].insert_child(1)
+        >>> a.children[0].insert_child(1)
+        >>> tree = tsmakers.ArrayTimespanTree(a)
+        >>> tree.get_level_order_value()
+        [[10], [2, 3], [1, 1]]
+
+        >>> list(tree.parents)
+        [-1, 0, 0, 1, 1]
+
+        >>> list(tree.first_children)
+        [1, 3, -1, -1, -1]
+
+        >>> list(tree.next_siblings)
+        [-1, 2, -1, 4, -1]
+
+        >>> tree.tspanlist() == tsmakers.TimespanTree(a).tspanlist()
+        True
+
+        >>> b = tree.to_node()
+        >>> tsmakers.TimespanTree(b).get_level_order_value()
+        [[10], [2, 3], [1, 1]]
+
+    ..  container:: example
+
+        With NumPy installed, offsets can be computed in bulk as integer
+        numerators over one common denominator per level:
+
+        >>> starts, stops, denominators = tree.get_offset_arrays()
+        >>> starts.tolist()
+        [0, 0, 20, 0, 20]
+
+        >>> stops.tolist()
+        [10, 20, 50, 20, 40]
+
+        >>> denominators.tolist()
+        [1, 5, 5, 10, 10]
+
+        >>> tree.tspanlist(vectorized=True, check=True) == tree.tspanlist()
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_durations",
+        "_first_children",
+        "_level_starts",
+        "_next_siblings",
+        "_offsets",
+        "_parents",
+        "_values",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, root):
+        first_children = array.array("q")
+        level_starts = array.array("q")
+        next_siblings = array.array("q")
+        parents = array.array("q")
+        values = array.array("q")
+        index = 0
+        parent_indices = [-1]
+        for level in iterate_levels(root):
+            level_starts.append(index)
+            next_parent_indices = []
+            for node, parent_index in zip(level, parent_indices):
+                parents.append(parent_index)
+                values.append(node.value)
+                next_siblings.append(-1)
+                first_children.append(-1)
+                next_parent_indices.extend(index for _ in node.children)
+                index += 1
+            parent_indices = next_parent_indices
+        level_starts.append(index)
+        previous_index = -1
+        for index, parent_index in enumerate(parents):
+            if parent_index == -1:
+                continue
+            if first_children[parent_index] == -1:
+                first_children[parent_index] = index
+            elif parents[previous_index] == parent_index:
+                next_siblings[previous_index] = index
+            previous_index = index
+        self._durations = None
+        self._first_children = first_children
+        self._level_starts = level_starts
+        self._next_siblings = next_siblings
+        self._offsets = None
+        self._parents = parents
+        self._values = values
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return len(self._values)
+
+    ### PRIVATE METHODS ###
+
+    def _compute_offsets(self):
+        durations = [self._values[0]]
+        offsets = [0]
+        for index, value in enumerate(self._values):
+            child = self._first_children[index]
+            if child == -1:
+                continue
+            total = 0
+            while child != -1:
+                total += self._values[child]
+                child = self._next_siblings[child]
+            duration = durations[index]
+            offset = offsets[index]
+            child = self._first_children[index]
+            while child != -1:
+                child_duration = (
+                    quicktions.Fraction(self._values[child], total) * duration
+                )
+                durations.append(child_duration)
+                offsets.append(offset)
+                offset += child_duration
+                child = self._next_siblings[child]
+        self._durations = durations
+        self._offsets = offsets
+
+    def _get_timespan(self, index):
+        if self._offsets is None:
+            self._compute_offsets()
+        offset = self._offsets[index]
+        return abjad.Timespan(offset, offset + self._durations[index])
+
+    def _make_timespans_from_arrays(self, check=False):
+        starts, stops, denominators = self.get_offset_arrays()
+        starts = starts.tolist()
+        stops = stops.tolist()
+        denominators = denominators.tolist()
+        if check:
+            for index, (start, stop, denominator) in enumerate(
+                zip(starts, stops, denominators)
+            ):
+                timespan = self._get_timespan(index)
+                start = quicktions.Fraction(start, denominator)
+                stop = quicktions.Fraction(stop, denominator)
+                if start != timespan.start_offset or stop != timespan.stop_offset:
+                    message = f"node {index}: vectorized offsets {start}, {stop}"
+                    message += f" differ from {timespan!r}."
+                    raise ValueError(message)
+        # Offsets are finite and ordered by construction, so skip the
+        # per-timespan validation in abjad.Timespan.__init__().
+        timespans = []
+        for start, stop, denominator in zip(starts, stops, denominators):
+            timespan = new_timespan(
+                abjad.Timespan,
+                abjad.Offset(start, denominator),
+                abjad.Offset(stop, denominator),
+            )
+            timespans.append(timespan)
+        return timespans
+
+    ### PUBLIC METHODS ###
+
+    def get_children(self, index):
+        children = []
+        child = self._first_children[index]
+        while child != -1:
+            children.append(child)
+            child = self._next_siblings[child]
+        return children
+
+    def get_duration(self, index):
+        if self._durations is None:
+            self._compute_offsets()
+        return self._durations[index]
+
+    def get_level(self, n):
+        return range(self._level_starts[n], self._level_starts[n + 1])
+
+    def get_offset_arrays(self):
+        r"""
+        Gets start and stop offsets of every node as NumPy arrays.
+
+        Returns start numerators, stop numerators and denominators, all in
+        level order. Nodes on the same level share a denominator. Levels
+        whose numerators could overflow int64 are computed with Python
+        integers in object arrays instead.
+        """
+        if numpy is None:
+            raise ImportError("get_offset_arrays() requires numpy.")
+        limit = 2**62
+        root_value = self._values[0]
+        parents = numpy.frombuffer(self._parents, dtype=numpy.int64)
+        values = numpy.frombuffer(self._values, dtype=numpy.int64)
+        dtype = numpy.int64
+        if limit <= abs(root_value):
+            dtype = object
+        starts = [numpy.zeros(1, dtype=dtype)]
+        durations = [numpy.full(1, root_value, dtype=dtype)]
+        denominators = [1]
+        for n in range(1, len(self._level_starts) - 1):
+            start, stop = self._level_starts[n], self._level_starts[n + 1]
+            parent_start = self._level_starts[n - 1]
+            local_parents = parents[start:stop] - parent_start
+            child_values = values[start:stop]
+            # Children are grouped by parent, so each sibling group is a run.
+            counts = numpy.bincount(local_parents, minlength=len(starts[-1]))
+            group_stops = numpy.cumsum(counts)
+            group_starts = group_stops - counts
+            cumulative_values = numpy.cumsum(child_values.astype(object))
+            cumulative_values = numpy.concatenate(([0], cumulative_values))
+            totals = (cumulative_values[group_stops] - cumulative_values[group_starts])[
+                local_parents
+            ]
+            multiplier = 1
+            for total in set(totals.tolist()):
+                multiplier = multiplier * total // math.gcd(multiplier, total)
+            denominator = denominators[-1] * multiplier
+            maximum_total = max(totals.tolist())
+            if limit <= abs(root_value) * denominator * maximum_total:
+                dtype = object
+            totals = totals.astype(dtype)
+            scales = numpy.array(multiplier, dtype=dtype) // totals
+            parent_durations = durations[-1].astype(dtype)[local_parents]
+            child_durations = parent_durations * scales * child_values.astype(dtype)
+            cumulative_durations = numpy.cumsum(child_durations)
+            cumulative_durations = numpy.concatenate(
+                (numpy.zeros(1, dtype=dtype), cumulative_durations)
+            )
+            local_offsets = (
+                cumulative_durations[:-1]
+                - cumulative_durations[group_starts[local_parents]]
+            )
+            parent_offsets = starts[-1].astype(dtype)[local_parents]
+            child_starts = parent_offsets * multiplier + local_offsets
+            starts.append(child_starts)
+            durations.append(child_durations)
+            denominators.append(denominator)
+        counts = numpy.diff(numpy.frombuffer(self._level_starts, dtype=numpy.int64))
+        if dtype is object:
+            starts = [_.astype(object) for _ in starts]
+            durations = [_.astype(object) for _ in durations]
+        starts = numpy.concatenate(starts)
+        stops = starts + numpy.concatenate(durations)
+        denominators = numpy.repeat(numpy.array(denominators, dtype=dtype), counts)
+        return starts, stops, denominators
+
+    def get_level_order(self):
+        return range(len(self._values))
+
+    def get_level_order_value(self):
+        return [self.get_level_value(n) for n in range(len(self._level_starts) - 1)]
+
+    def get_level_value(self, n):
+        start, stop = self._level_starts[n], self._level_starts[n + 1]
+        return self._values[start:stop].tolist()
+
+    def get_offset(self, index):
+        if self._offsets is None:
+            self._compute_offsets()
+        return self._offsets[index]
+
+    def iterate_depths(self):
+        for depth in range(len(self._level_starts) - 1):
+            for index in self.get_level(depth):
+                yield depth, index
+
+    def iterate_timespans(self, start_offset=None, stop_offset=None):
+        r"""
+        Iterates timespans in start offset order, like
+        ``TimespanTree.iterate_timespans()``.
+
+        ..  container:: example
+
+            >>> a = tsmakers.TimespanTreeNode(4)
+            >>> a.insert_child(1)
+            >>> a.insert_child(1)
+            >>> for child in a.children:
+            ...     child.insert_child(1)
+            ...     child.insert_child(3)
+            ...
+            >>> tree = tsmakers.ArrayTimespanTree(a)
+            >>> list(tree.iterate_timespans()) == list(
+            ...     tsmakers.TimespanTree(a).iterate_timespans()
+            ... )
+            True
+
+            >>> for timespan in tree.iterate_timespans(
+            ...     start_offset=abjad.Offset(3),
+            ... ):
+            ...     timespan
+            ...
+            Timespan(Offset((0, 1)), Offset((4, 1)))
+            Timespan(Offset((2, 1)), Offset((4, 1)))
+            Timespan(Offset((5, 2)), Offset((4, 1)))
+
+        """
+        first_children = self._first_children
+        next_siblings = self._next_siblings
+        values = self._values
+        # Entries are (start, depth, sequence, stop, index, scale), where
+        # ``scale`` is the parent's duration per unit of child value.
+        heap = [(0, 0, 0, values[0], 0, None)]
+        sequence = 1
+        while heap:
+            start, depth, _, stop, index, scale = heapq.heappop(heap)
+            if stop_offset is not None and stop_offset <= start:
+                break
+            sibling = next_siblings[index]
+            if sibling != -1:
+                heapq.heappush(
+                    heap,
+                    (
+                        stop,
+                        depth,
+                        sequence,
+                        stop + values[sibling] * scale,
+                        sibling,
+                        scale,
+                    ),
+                )
+                sequence += 1
+            if start_offset is not None and stop <= start_offset:
+                continue
+            yield abjad.Timespan(start, stop)
+            child = first_children[index]
+            if child != -1:
+                total = sum(values[_] for _ in self.get_children(index))
+                child_scale = quicktions.Fraction(stop - start) / total
+                heapq.heappush(
+                    heap,
+                    (
+                        start,
+                        depth + 1,
+                        sequence,
+                        start + values[child] * child_scale,
+                        child,
+                        child_scale,
+                    ),
+                )
+                sequence += 1
+
+    def replace_values(self, lst):
+        for index, value in zip(range(len(self._values)), lst):
+            self._values[index] = value
+        self._durations = None
+        self._offsets = None
 
     def show(self):
         abjad.show(self.tspanlist(), scale=0.7)
 
     def show_level(self, n):
         abjad.show(self.tspanlist_level(n), scale=0.7)
+
+    def to_node(self):
+        nodes = [TimespanTreeNode(self._values[0])]
+        for index in range(1, len(self._values)):
+            parent = nodes[self._parents[index]]
+            parent.insert_child(self._values[index])
+            nodes.append(parent.children[-1])
+        return nodes[0]
+
+    def to_tree(self):
+        return TimespanTree(self.to_node())
+
+    def tspanlist_level(self, n):
+        return abjad.TimespanList([self._get_timespan(i) for i in self.get_level(n)])
+
+    def tspanlist_window(self, timespan):
+        r"""
+        Gets timespans intersecting ``timespan``, in level order, like
+        ``TimespanTree.tspanlist_window()``.
+
+        Children are numbered consecutively and parent indices never
+        decrease, so the children overlapping ``timespan`` are found by
+        bisecting the offset and parent arrays.
+
+        ..  container:: example
+
+            >>> a = tsmakers.TimespanTreeNode(4)
+            >>> a.insert_child(1)
+            >>> a.insert_child(1)
+            >>> for child in a.children:
+            ...     child.insert_child(1)
+            ...     child.insert_child(3)
+            ...
+            >>> tree = tsmakers.ArrayTimespanTree(a)
+            >>> tree.tspanlist_window(abjad.Timespan(1, 5)) == (
+            ...     tsmakers.TimespanTree(a).tspanlist_window(abjad.Timespan(1, 5))
+            ... )
+            True
+
+        """
+        if self._offsets is None:
+            self._compute_offsets()
+        start_offset = timespan.start_offset
+        stop_offset = timespan.stop_offset
+        durations, offsets, parents = self._durations, self._offsets, self._parents
+        timespans = []
+        frontier = [0]
+        while frontier:
+            next_frontier = []
+            for index in frontier:
+                offset = offsets[index]
+                if stop_offset <= offset or offset + durations[index] <= start_offset:
+                    continue
+                timespans.append(self._get_timespan(index))
+                low = self._first_children[index]
+                if low == -1:
+                    continue
+                high = bisect.bisect_right(parents, index, low)
+                start = bisect.bisect_right(offsets, start_offset, low, high) - 1
+                stop = bisect.bisect_left(offsets, stop_offset, low, high)
+                next_frontier.extend(range(max(start, low), stop))
+            frontier = next_frontier
+        return abjad.TimespanList(timespans)
+
+    def tspanlist(self, vectorized=False, check=False):
+        if vectorized:
+            return abjad.TimespanList(self._make_timespans_from_arrays(check=check))
+        return abjad.TimespanList(
+            [self._get_timespan(i) for i in self.get_level_order()]
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def first_children(self):
+        return self._first_children
+
+    @property
+    def level_starts(self):
+        return self._level_starts
+
+    @property
+    def levelbylevel(self):
+        return [self.get_level(n) for n in range(len(self._level_starts) - 1)]
+
+    @property
+    def levelorder(self):
+        return self.get_level_order()
+
+    @property
+    def next_siblings(self):
+        return self._next_siblings
+
+    @property
+    def parents(self):
+        return self._parents
+
+    @property
+    def values(self):
+        return self._values
+
+
+class SharedTimespanTree(object):
+    r"""
+    A timespan tree that stores structurally identical subtrees once.
+
+    A subtree's shape is the sequence of its children's weights and
+    shapes. Shapes are interned, so the tree is a DAG of unique shapes, and
+    each shape's relative child layout is computed once. Producing
+    timespans scales and translates those layouts for every occurrence.
+
+    Nodes are numbered in level order, as in ``ArrayTimespanTree``, and are
+    found from their index without expanding the tree.
+
+    ..  container:: example
+
+        >>> a = tsmakers.TimespanTreeNode(10)
+        >>> a.insert_child(8)
+        >>> a.insert_child(5)
+        >>> for child in a.children:
+        ...     child.insert_child(8)
+        ...     child.insert_child(5)
+        ...
+        >>> tree = tsmakers.SharedTimespanTree(a)
+        >>> tree.get_node_count()
+        7
+
+        >>> len(tree.shapes)
+        3
+
+        >>> tree.tspanlist() == tsmakers.TimespanTree(a).tspanlist()
+        True
+
+        >>> tree.replace_values([10, 5, 8, 8, 5, 8, 5])
+        >>> tree.get_level_order_value()
+        [[10], [5, 8], [8, 5, 8, 5]]
+
+        >>> len(tree.shapes)
+        3
+
+    ..  container:: example
+
+        Trees can be grown from rewrite rules without building every node:
+
+        >>> tree = tsmakers.SharedTimespanTree.from_rules(
+        ...     10,
+        ...     (1, [8, 5]),
+        ...     generations=30,
+        ... )
+        >>> tree.get_node_count()
+        2147483647
+
+        >>> len(tree.shapes)
+        31
+
+        >>> tree.get_level_sizes()[:5]
+        [1, 2, 4, 8, 16]
+
+        >>> for timespan in tree.tspanlist_level(1):
+        ...     timespan.start_offset, timespan.stop_offset
+        ...
+        (Offset((0, 1)), Offset((80, 13)))
+        (Offset((80, 13)), Offset((10, 1)))
+
+        >>> tree.get_level(1)
+        range(1, 3)
+
+        >>> index = tree.get_node_count() - 1
+        >>> tree.get_offset(index) + tree.get_duration(index)
+        Fraction(10, 1)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_layouts",
+        "_level_sizes",
+        "_node_counts",
+        "_root_shape",
+        "_root_value",
+        "_shape_indices",
+        "_shapes",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, root=None):
+        self._set_root(root)
+
+    ### PRIVATE METHODS ###
+
+    def _get_layout(self, shape):
+        if shape not in self._layouts:
+            children = self._shapes[shape]
+            total = tally([value for value, _ in children])
+            layout = []
+            start = 0
+            for value, child_shape in children:
+                layout.append(
+                    (
+                        child_shape,
+                        quicktions.Fraction(start, total),
+                        quicktions.Fraction(value, total),
+                        value,
+                    )
+                )
+                start += value
+            self._layouts[shape] = tuple(layout)
+        return self._layouts[shape]
+
+    def _intern(self, shape):
+        if shape not in self._shape_indices:
+            self._shape_indices[shape] = len(self._shapes)
+            self._shapes.append(shape)
+        return self._shape_indices[shape]
+
+    def _locate(self, index):
+        # Descends from the root, skipping children whose subtrees hold too
+        # few nodes at the index's depth. Returns offset and duration.
+        sizes = self.get_level_sizes()
+        if not 0 <= index:
+            raise IndexError(index)
+        depth = 0
+        while sizes[depth] <= index:
+            index -= sizes[depth]
+            depth += 1
+            if depth == len(sizes):
+                raise IndexError(index)
+        shape, offset, duration = self._root_shape, 0, self._root_value
+        for remaining in reversed(range(depth)):
+            for child_shape, start, width, _ in self._get_layout(shape):
+                child_sizes = self._level_sizes[child_shape]
+                count = child_sizes[remaining] if remaining < len(child_sizes) else 0
+                if index < count:
+                    break
+                index -= count
+            shape = child_shape
+            offset += start * duration
+            duration *= width
+        return offset, duration
+
+    def _set_root(self, root):
+        self._layouts = {}
+        self._level_sizes = {}
+        self._node_counts = {}
+        self._shape_indices = {}
+        self._shapes = []
+        self._intern(())
+        self._root_shape = 0
+        self._root_value = None
+        if root is not None:
+            shapes = {}
+            for level in reversed(levelbylevel(root)):
+                for node in level:
+                    shapes[node] = self._intern(
+                        tuple((child.value, shapes[child]) for child in node.children)
+                    )
+            self._root_shape = shapes[root]
+            self._root_value = root.value
+
+    def _iterate_frontiers(self):
+        frontier = [(self._root_shape, self._root_value, 0, self._root_value)]
+        while frontier:
+            yield frontier
+            next_frontier = []
+            for shape, _, offset, duration in frontier:
+                for child_shape, start, width, value in self._get_layout(shape):
+                    next_frontier.append(
+                        (
+                            child_shape,
+                            value,
+                            offset + start * duration,
+                            width * duration,
+                        )
+                    )
+            frontier = next_frontier
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_rules(class_, value, rulelst, generations):
+        r"""
+        Makes shared timespan tree grown from ``value`` by ``rulelst``.
+
+        Rules work as in ``divrewrite()``. Equal values at equal depth
+        share one subtree, so the cost grows with the number of distinct
+        values and generations rather than with the number of nodes.
+        """
+        rules = _coerce_rules(rulelst)
+        cache = {}
+        tree = class_()
+        shapes = {}
+        # Build bottom-up: shapes[(value, g)] is the subtree grown for g
+        # more generations.
+        values = {value}
+        reachable = [values]
+        for _ in range(generations):
+            values = {
+                child for value_ in values for child in _rewrite(value_, rules, cache)
+            }
+            reachable.append(values)
+        for depth in reversed(range(generations + 1)):
+            remaining = generations - depth
+            for value_ in reachable[depth]:
+                if remaining == 0:
+                    children = ()
+                else:
+                    children = _rewrite(value_, rules, cache)
+                shapes[(value_, remaining)] = tree._intern(
+                    tuple((child, shapes[(child, remaining - 1)]) for child in children)
+                )
+        tree._root_shape = shapes[(value, generations)]
+        tree._root_value = value
+        return tree
+
+    def get_duration(self, index):
+        return self._locate(index)[1]
+
+    def get_level(self, n):
+        sizes = self.get_level_sizes()
+        start = sum(sizes[:n])
+        return range(start, start + sizes[n])
+
+    def get_level_order_value(self):
+        return [
+            [value for _, value, _, _ in frontier]
+            for frontier in self._iterate_frontiers()
+        ]
+
+    def get_level_sizes(self):
+        r"""
+        Gets number of nodes on each level, without expanding the tree.
+        """
+        for shape in range(len(self._shapes)):
+            if shape in self._level_sizes:
+                continue
+            sizes = [1]
+            for _, child_shape in self._shapes[shape]:
+                child_sizes = self._level_sizes[child_shape]
+                for depth, size in enumerate(child_sizes, 1):
+                    if depth == len(sizes):
+                        sizes.append(0)
+                    sizes[depth] += size
+            self._level_sizes[shape] = sizes
+        return list(self._level_sizes[self._root_shape])
+
+    def get_level_value(self, n):
+        for depth, frontier in enumerate(self._iterate_frontiers()):
+            if depth == n:
+                return [value for _, value, _, _ in frontier]
+        raise IndexError(n)
+
+    def get_node_count(self):
+        r"""
+        Gets number of nodes, without expanding the tree.
+        """
+        for shape in range(len(self._shapes)):
+            if shape not in self._node_counts:
+                self._node_counts[shape] = 1 + sum(
+                    self._node_counts[child_shape]
+                    for _, child_shape in self._shapes[shape]
+                )
+        return self._node_counts[self._root_shape]
+
+    def get_offset(self, index):
+        return self._locate(index)[0]
+
+    def replace_values(self, lst):
+        r"""
+        Replaces node values in level order with those in ``lst``.
+
+        Subtrees which no longer match are unshared, so this expands the
+        tree and interns its shapes again.
+        """
+        root = self.to_node()
+        for node, value in zip(flatten(levelbylevel(root)), lst):
+            node.value = value
+        self._set_root(root)
+
+    def show(self):
+        abjad.show(self.tspanlist(), scale=0.7)
+
+    def show_level(self, n):
+        abjad.show(self.tspanlist_level(n), scale=0.7)
+
+    def to_node(self):
+        root = TimespanTreeNode(self._root_value)
+        stack = [(root, self._root_shape)]
+        while stack:
+            node, shape = stack.pop()
+            for value, child_shape in self._shapes[shape]:
+                node.insert_child(value)
+                stack.append((node.children[-1], child_shape))
+        return root
+
+    def tspanlist_level(self, n):
+        for depth, frontier in enumerate(self._iterate_frontiers()):
+            if depth == n:
+                return abjad.TimespanList(
+                    [
+                        abjad.Timespan(offset, offset + duration)
+                        for _, _, offset, duration in frontier
+                    ]
+                )
+        raise IndexError(n)
+
+    def tspanlist(self):
+        return abjad.TimespanList(
+            [
+                abjad.Timespan(offset, offset + duration)
+                for frontier in self._iterate_frontiers()
+                for _, _, offset, duration in frontier
+            ]
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def root_value(self):
+        return self._root_value
+
+    @property
+    def shapes(self):
+        return tuple(self._shapes)